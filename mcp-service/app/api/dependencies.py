@@ -1,7 +1,10 @@
 from fastapi import Depends, HTTPException, Request, status
 from typing import Optional
+import httpx
 
 from app.config import get_settings, Settings
+from app.api.middlewares.correlation_id import correlation_id_var
+from app.api.middlewares.tenant_context import tenant_id_var
 from app.channels.channel_factory import ChannelFactory
 from app.domain.services.message_service import MessageService
 from app.infrastructure.repositories.tenant_repository import TenantRepository
@@ -41,15 +44,14 @@ def get_message_service(
 
 # Current tenant dependency
 async def get_current_tenant(
-    request: Request,
     tenant_repository: TenantRepository = Depends(get_tenant_repository)
 ) -> Tenant:
     """
     Extracts and validates the current tenant from request.
     
-    Requires tenant_context_middleware to be active.
+    Requires CorrelationIdASGIMiddleware to be active.
     """
-    tenant_id = getattr(request.state, "tenant_id", None)
+    tenant_id = tenant_id_var.get()
     
     if not tenant_id:
         raise HTTPException(
@@ -68,17 +70,24 @@ async def get_current_tenant(
     return tenant
 
 # Correlation ID dependency
-def get_correlation_id(request: Request) -> str:
+def get_correlation_id() -> str:
     """
-    Extracts the correlation ID from request state.
+    Provides the correlation ID of the current request.
     
-    Requires correlation_id_middleware to be active.
+    Requires CorrelationIdASGIMiddleware to be active.
     """
-    return getattr(request.state, "correlation_id", "unknown")
+    return correlation_id_var.get()
 
 # Connection manager dependency
 def get_connection_manager(request: Request):
     """
     Provides the connection manager instance from app state.
     """
-    return request.app.state.connection_manager
\ No newline at end of file
+    return request.app.state.connection_manager
+
+# HTTP client dependency
+def get_http(request: Request) -> httpx.AsyncClient:
+    """
+    Provides the pooled HTTP client from app state.
+    """
+    return request.app.state.http_client
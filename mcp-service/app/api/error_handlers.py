@@ -3,6 +3,7 @@ from fastapi.responses import JSONResponse
 import logging
 from typing import Dict, Any, Optional
 
+from app.api.middlewares.correlation_id import correlation_id_var
 from app.domain.exceptions import (
     APIException,
     ValidationException,
@@ -100,7 +101,7 @@ def setup_exception_handlers(app: FastAPI) -> None:
         Handles all other Exception instances.
         Logs the error and returns a generic error response.
         """
-        correlation_id = getattr(request.state, "correlation_id", "unknown")
+        correlation_id = correlation_id_var.get()
         
         logging.error(
             f"Unhandled exception: {str(exc)}",
@@ -126,7 +127,7 @@ def create_error_response(
     """
     Creates a standardized error response.
     """
-    correlation_id = getattr(request.state, "correlation_id", "unknown")
+    correlation_id = correlation_id_var.get()
     
     # Log the error
     logging.error(
@@ -0,0 +1,41 @@
+"""
+CORS middleware.
+
+Starlette's CORSMiddleware with origin checks against a hash set instead of
+the configured origin list.
+"""
+
+from typing import Sequence
+
+from fastapi.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp
+
+
+class OriginSetCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware that matches request origins in constant time.
+
+    The base class checks origins with a membership test on the configured
+    sequence, which is a linear scan for a list. Preflight and simple
+    response headers are still prepared once by the base class.
+    """
+
+    def __init__(self, app: ASGIApp, allow_origins: Sequence[str] = (), **kwargs):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The ASGI application to wrap
+            allow_origins: Allowed origins, or ["*"] to allow any origin
+            **kwargs: Remaining CORSMiddleware options
+        """
+        super().__init__(app, allow_origins=allow_origins, **kwargs)
+        self._origin_set = frozenset(allow_origins)
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        if self.allow_all_origins or origin in self._origin_set:
+            return True
+        return (
+            self.allow_origin_regex is not None
+            and self.allow_origin_regex.fullmatch(origin) is not None
+        )
@@ -2,15 +2,18 @@
 MCP service middleware package.
 
 This package contains custom middleware components used by the MCP service,
-including correlation ID, tenant context, and rate limiting middleware.
+including CORS, correlation ID and tenant context, and rate limiting middleware.
 """
 
-from app.api.middlewares.correlation_id import correlation_id_middleware
-from app.api.middlewares.tenant_context import tenant_context_middleware
+from app.api.middlewares.cors import OriginSetCORSMiddleware
+from app.api.middlewares.correlation_id import CorrelationIdASGIMiddleware, correlation_id_var
+from app.api.middlewares.tenant_context import tenant_id_var
 from app.api.middlewares.rate_limiting import rate_limiting_middleware
 
 __all__ = [
-    "correlation_id_middleware",
-    "tenant_context_middleware",
+    "OriginSetCORSMiddleware",
+    "CorrelationIdASGIMiddleware",
+    "correlation_id_var",
+    "tenant_id_var",
     "rate_limiting_middleware",
 ]
\ No newline at end of file
@@ -0,0 +1,17 @@
+"""
+Tenant context.
+
+Makes the tenant named by the X-Tenant-ID request header available to the
+rest of the request handling. The header is read by
+CorrelationIdASGIMiddleware in the same pass as the correlation header.
+"""
+
+from contextvars import ContextVar
+from typing import Optional
+
+# ASGI header names are lowercase bytes
+TENANT_ID_HEADER = b"x-tenant-id"
+
+# Tenant ID of the request being handled, or None if the request named none
+tenant_id_var: ContextVar[Optional[str]] = ContextVar("tenant_id", default=None)
+
@@ -1,15 +1,66 @@
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import Dict, List, Optional, Any
+from starlette.websockets import WebSocketState
+from typing import Dict, List, Optional, Any, Set, Tuple
+from collections import defaultdict
+import heapq
+import itertools
 import logging
 import asyncio
 import time
 import uuid
 from datetime import datetime
 
+import orjson
+
+# Upper bound for a single WebSocket send/close before the peer is treated as hung
+SEND_TIMEOUT = 2.0
+
+# Seconds between heartbeat rounds
+HEARTBEAT_INTERVAL = 30
+
+# Connections without activity for this many seconds are cleaned up
+STALE_CONNECTION_TIMEOUT = 300  # 5 minutes
+
+# Number of connections whose sends are issued concurrently by heartbeats
+# and broadcasts
+SEND_SHARD_SIZE = 500
+
+
+def tenant_channel(tenant_id: str) -> str:
+    """
+    Returns the pub/sub channel every connection of a tenant is subscribed to.
+    """
+    return f"tenant:{tenant_id}"
+
+
+def user_channel(tenant_id: str, user_id: str) -> str:
+    """
+    Returns the pub/sub channel every connection of a user is subscribed to.
+    """
+    return f"user:{tenant_id}:{user_id}"
+
+
+def encode_message(message: Any) -> str:
+    """
+    Encodes a message as a compact JSON text frame.
+    """
+    return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+
 class ConnectionInfo:
     """
     Stores information about a WebSocket connection.
     """
+    __slots__ = (
+        "websocket",
+        "tenant_id",
+        "user_id",
+        "client_id",
+        "connected_at",
+        "last_activity_at",
+        "metadata",
+        "_last_activity_monotonic",
+    )
+    
     def __init__(
         self,
         websocket: WebSocket,
@@ -24,14 +75,25 @@ class ConnectionInfo:
         self.client_id = client_id
         self.connected_at = connected_at or datetime.now()
         self.last_activity_at = self.connected_at
-        self.is_alive = True
         self.metadata = {}
+        self._last_activity_monotonic = time.monotonic()
+    
+    @property
+    def is_alive(self) -> bool:
+        """
+        Whether both sides of the WebSocket are still connected.
+        """
+        return (
+            self.websocket.client_state == WebSocketState.CONNECTED and
+            self.websocket.application_state == WebSocketState.CONNECTED
+        )
     
     def update_activity(self):
         """
         Updates the last activity timestamp.
         """
         self.last_activity_at = datetime.now()
+        self._last_activity_monotonic = time.monotonic()
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -58,24 +120,107 @@ class ConnectionManager:
         # Active connections organized as tenant_id -> user_id -> client_id -> ConnectionInfo
         self.active_connections: Dict[str, Dict[str, Dict[str, ConnectionInfo]]] = {}
         
+        # Flat index of the same connections keyed by (tenant_id, user_id, client_id)
+        self._connections: Dict[Tuple[str, str, str], ConnectionInfo] = {}
+        
+        # Min-heap of (last_activity_monotonic, seq, ConnectionInfo), one entry per
+        # connection; entries are refreshed lazily when popped by the cleanup task
+        self._activity_heap: List[Tuple[float, int, ConnectionInfo]] = []
+        self._heap_seq = itertools.count()
+        
+        # Pub/sub registry: channel name -> subscribed connection keys, plus the
+        # reverse mapping used to drop a connection's subscriptions on disconnect
+        self._channels: Dict[str, Set[Tuple[str, str, str]]] = defaultdict(set)
+        self._subscriptions: Dict[Tuple[str, str, str], Set[str]] = defaultdict(set)
+        
+        # Connection counters maintained on connect/disconnect so counts are O(1)
+        self._total = 0
+        self._per_tenant: Dict[str, int] = defaultdict(int)
+        self._per_user: Dict[Tuple[str, str], int] = defaultdict(int)
+        
         # Start background tasks
         self.background_tasks = set()
+        self._timer_handles: Dict[str, asyncio.TimerHandle] = {}
         self.start_background_tasks()
     
     def start_background_tasks(self):
         """
         Starts background tasks for connection management.
         """
-        heartbeat_task = asyncio.create_task(self._heartbeat_task())
-        cleanup_task = asyncio.create_task(self._cleanup_task())
+        # Heartbeat and cleanup rounds are driven by event loop timers rather
+        # than long-running sleep loops; each round re-arms its own timer
+        self._schedule_periodic("heartbeat", HEARTBEAT_INTERVAL, self._heartbeat_round)
+        self._schedule_periodic("cleanup", STALE_CONNECTION_TIMEOUT, self._cleanup_round)
+    
+    def _schedule_periodic(
+        self,
+        name: str,
+        interval: float,
+        job,
+        fire_at: Optional[float] = None
+    ) -> None:
+        """
+        Arms the timer for the next round of a periodic job.
+        
+        Args:
+            name: Key of the timer handle, used to cancel it on shutdown
+            interval: Seconds between rounds
+            job: Coroutine function run once per round
+            fire_at: Loop time of the next round, defaults to one interval from now
+        """
+        loop = asyncio.get_running_loop()
+        if fire_at is None:
+            fire_at = loop.time() + interval
+        
+        self._timer_handles[name] = loop.call_at(
+            fire_at, self._fire_periodic, name, interval, job, fire_at
+        )
+    
+    def _fire_periodic(self, name: str, interval: float, job, fired_at: float) -> None:
+        """
+        Timer callback that runs one round of a periodic job in a task.
+        """
+        # The set holds strong references, since the event loop only keeps
+        # weak references to running tasks
+        task = asyncio.create_task(self._run_periodic(name, interval, job, fired_at))
+        self.background_tasks.add(task)
+        task.add_done_callback(self.background_tasks.discard)
+    
+    async def _run_periodic(self, name: str, interval: float, job, fired_at: float) -> None:
+        """
+        Runs one round of a periodic job and re-arms its timer.
+        
+        The next round is scheduled from the previous fire time rather than
+        from when this round finished, so slow rounds do not accumulate drift.
+        Rounds that were missed entirely are skipped instead of run back to back.
+        """
+        try:
+            await job()
+        except Exception as e:
+            logging.error(f"Error in {name} task: {str(e)}", exc_info=True)
+        
+        next_fire = fired_at + interval
+        now = asyncio.get_running_loop().time()
+        while next_fire <= now:
+            next_fire += interval
+        
+        self._schedule_periodic(name, interval, job, next_fire)
+    
+    async def shutdown(self) -> None:
+        """
+        Cancels background tasks and waits for them to exit.
+        """
+        for handle in self._timer_handles.values():
+            handle.cancel()
+        self._timer_handles.clear()
         
-        # Keep reference to tasks to prevent garbage collection
-        self.background_tasks.add(heartbeat_task)
-        self.background_tasks.add(cleanup_task)
+        # Cancelled rounds exit without re-arming their timer
+        tasks = list(self.background_tasks)
+        for task in tasks:
+            task.cancel()
         
-        # Remove task from set when done
-        heartbeat_task.add_done_callback(self.background_tasks.discard)
-        cleanup_task.add_done_callback(self.background_tasks.discard)
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.background_tasks.clear()
     
     async def connect(
         self,
@@ -112,7 +257,22 @@ class ConnectionManager:
             client_id=client_id
         )
         
-        self.active_connections[tenant_id][user_id][client_id] = connection_info
+        user_connections = self.active_connections[tenant_id][user_id]
+        if client_id not in user_connections:
+            self._total += 1
+            self._per_tenant[tenant_id] += 1
+            self._per_user[(tenant_id, user_id)] += 1
+        
+        user_connections[client_id] = connection_info
+        self._connections[(tenant_id, user_id, client_id)] = connection_info
+        heapq.heappush(
+            self._activity_heap,
+            (connection_info._last_activity_monotonic, next(self._heap_seq), connection_info)
+        )
+        
+        # Every connection receives its tenant's and user's broadcasts
+        self.subscribe(tenant_id, user_id, client_id, tenant_channel(tenant_id))
+        self.subscribe(tenant_id, user_id, client_id, user_channel(tenant_id, user_id))
         
         logging.info(
             f"WebSocket connected for tenant {tenant_id}, user {user_id}, client {client_id}",
@@ -134,23 +294,24 @@ class ConnectionManager:
         """
         Removes a WebSocket connection.
         """
-        if (
-            tenant_id in self.active_connections and
-            user_id in self.active_connections[tenant_id] and
-            client_id in self.active_connections[tenant_id][user_id]
-        ):
-            # Get connection info
-            connection_info = self.active_connections[tenant_id][user_id][client_id]
-            
+        connection_info = self._connections.get((tenant_id, user_id, client_id))
+        if connection_info is not None:
             # Remove connection
             del self.active_connections[tenant_id][user_id][client_id]
+            del self._connections[(tenant_id, user_id, client_id)]
+            self._unsubscribe_all((tenant_id, user_id, client_id))
+            self._total -= 1
+            self._per_tenant[tenant_id] -= 1
+            self._per_user[(tenant_id, user_id)] -= 1
             
             # Cleanup empty dictionaries
             if not self.active_connections[tenant_id][user_id]:
                 del self.active_connections[tenant_id][user_id]
+                del self._per_user[(tenant_id, user_id)]
             
             if not self.active_connections[tenant_id]:
                 del self.active_connections[tenant_id]
+                del self._per_tenant[tenant_id]
             
             logging.info(
                 f"WebSocket disconnected for tenant {tenant_id}, user {user_id}, client {client_id}",
@@ -161,9 +322,10 @@ class ConnectionManager:
                 }
             )
             
-            # Close WebSocket if still open
+            # Close WebSocket if still open; a hung peer must not stall eviction
             try:
-                await connection_info.websocket.close()
+                async with asyncio.timeout(SEND_TIMEOUT):
+                    await connection_info.websocket.close()
             except Exception:
                 pass
     
@@ -179,65 +341,189 @@ class ConnectionManager:
         
         Returns True if the message was sent successfully, False otherwise.
         """
-        if (
-            tenant_id in self.active_connections and
-            user_id in self.active_connections[tenant_id] and
-            client_id in self.active_connections[tenant_id][user_id]
-        ):
-            connection_info = self.active_connections[tenant_id][user_id][client_id]
-            
-            try:
-                # Send message
-                await connection_info.websocket.send_json(message)
-                
-                # Update activity timestamp
-                connection_info.update_activity()
-                
-                return True
-            except WebSocketDisconnect:
-                # Handle disconnection
-                await self.disconnect(tenant_id, user_id, client_id)
-            except Exception as e:
-                logging.error(
-                    f"Error sending message to WebSocket: {str(e)}",
-                    extra={
-                        "tenant_id": tenant_id,
-                        "user_id": user_id,
-                        "client_id": client_id
-                    },
-                    exc_info=True
-                )
+        connection_info = self._connections.get((tenant_id, user_id, client_id))
+        if connection_info is None:
+            return False
         
-        return False
+        return await self._send_to_connection(connection_info, encode_message(message))
     
-    async def broadcast_to_user(
+    def subscribe(
+        self,
+        tenant_id: str,
+        user_id: str,
+        client_id: str,
+        channel_name: str
+    ) -> bool:
+        """
+        Subscribes a connection to a pub/sub channel.
+        
+        Returns True if the connection exists and was subscribed, False otherwise.
+        """
+        key = (tenant_id, user_id, client_id)
+        if key not in self._connections:
+            return False
+        
+        self._channels[channel_name].add(key)
+        self._subscriptions[key].add(channel_name)
+        return True
+    
+    def unsubscribe(
         self,
         tenant_id: str,
         user_id: str,
+        client_id: str,
+        channel_name: str
+    ) -> None:
+        """
+        Removes a connection's subscription to a pub/sub channel.
+        """
+        key = (tenant_id, user_id, client_id)
+        
+        subscribers = self._channels.get(channel_name)
+        if subscribers is not None:
+            subscribers.discard(key)
+            if not subscribers:
+                del self._channels[channel_name]
+        
+        channels = self._subscriptions.get(key)
+        if channels is not None:
+            channels.discard(channel_name)
+            if not channels:
+                del self._subscriptions[key]
+    
+    def _unsubscribe_all(self, key: Tuple[str, str, str]) -> None:
+        """
+        Removes every subscription held by a connection.
+        """
+        for channel_name in self._subscriptions.pop(key, ()):
+            subscribers = self._channels.get(channel_name)
+            if subscribers is not None:
+                subscribers.discard(key)
+                if not subscribers:
+                    del self._channels[channel_name]
+    
+    async def publish(
+        self,
+        channel_name: str,
         message: Any
     ) -> int:
         """
-        Broadcasts a message to all connections for a specific user.
+        Publishes a message to every connection subscribed to a channel.
+        
+        The message is encoded once and the same frame is sent to each subscriber.
+        
+        Returns the number of connections that received the message.
+        """
+        subscribers = self._channels.get(channel_name)
+        if not subscribers:
+            return 0
+        
+        # Resolve the keys up front since failed sends disconnect and unsubscribe
+        connections = [
+            connection_info
+            for connection_info in map(self._connections.get, list(subscribers))
+            if connection_info is not None
+        ]
+        
+        return await self._send_to_many(connections, encode_message(message))
+    
+    async def _send_to_many(
+        self,
+        connections: List[ConnectionInfo],
+        payload: str
+    ) -> int:
+        """
+        Sends an encoded message to many connections.
+        
+        Connections are processed in shards whose sends run concurrently, so
+        slow peers in a shard overlap instead of delaying every connection
+        behind them.
         
         Returns the number of connections that received the message.
         """
         sent_count = 0
         
-        if (
-            tenant_id in self.active_connections and
-            user_id in self.active_connections[tenant_id]
-        ):
-            # Get all clients for the user
-            clients = list(self.active_connections[tenant_id][user_id].keys())
-            
-            # Send message to each client
-            for client_id in clients:
-                success = await self.send_message(tenant_id, user_id, client_id, message)
-                if success:
-                    sent_count += 1
+        for start in range(0, len(connections), SEND_SHARD_SIZE):
+            shard = connections[start:start + SEND_SHARD_SIZE]
+            # _send_to_connection handles its own errors, so no result is an exception
+            results = await asyncio.gather(
+                *(self._send_to_connection(connection_info, payload) for connection_info in shard)
+            )
+            sent_count += sum(results)
         
         return sent_count
     
+    async def _send_to_connection(
+        self,
+        connection_info: ConnectionInfo,
+        payload: str
+    ) -> bool:
+        """
+        Sends an encoded message to a single connection, bounded by SEND_TIMEOUT.
+        
+        A send that does not complete in time schedules the connection's
+        disconnect, so one hung socket cannot block broadcasts or
+        the background tasks.
+        """
+        tenant_id = connection_info.tenant_id
+        user_id = connection_info.user_id
+        client_id = connection_info.client_id
+        
+        # Skip sockets that are already closed but not yet cleaned up, rather
+        # than paying for the exception raised by sending on them
+        if not connection_info.is_alive:
+            return False
+        
+        try:
+            # Send message
+            async with asyncio.timeout(SEND_TIMEOUT):
+                await connection_info.websocket.send_text(payload)
+            
+            # Update activity timestamp
+            connection_info.update_activity()
+            
+            return True
+        except WebSocketDisconnect:
+            # Handle disconnection
+            await self.disconnect(tenant_id, user_id, client_id)
+        except TimeoutError:
+            logging.warning(
+                "Timed out sending message to WebSocket",
+                extra={
+                    "tenant_id": tenant_id,
+                    "user_id": user_id,
+                    "client_id": client_id
+                }
+            )
+            disconnect_task = asyncio.create_task(self.disconnect(tenant_id, user_id, client_id))
+            self.background_tasks.add(disconnect_task)
+            disconnect_task.add_done_callback(self.background_tasks.discard)
+        except Exception as e:
+            logging.error(
+                f"Error sending message to WebSocket: {str(e)}",
+                extra={
+                    "tenant_id": tenant_id,
+                    "user_id": user_id,
+                    "client_id": client_id
+                },
+                exc_info=True
+            )
+        
+        return False
+    
+    async def broadcast_to_user(
+        self,
+        tenant_id: str,
+        user_id: str,
+        message: Any
+    ) -> int:
+        """
+        Broadcasts a message to all connections for a specific user.
+        
+        Returns the number of connections that received the message.
+        """
+        return await self.publish(user_channel(tenant_id, user_id), message)
+    
     async def broadcast_to_tenant(
         self,
         tenant_id: str,
@@ -248,17 +534,7 @@ class ConnectionManager:
         
         Returns the number of connections that received the message.
         """
-        sent_count = 0
-        
-        if tenant_id in self.active_connections:
-            # Get all users for the tenant
-            users = list(self.active_connections[tenant_id].keys())
-            
-            # Send message to each user
-            for user_id in users:
-                sent_count += await self.broadcast_to_user(tenant_id, user_id, message)
-        
-        return sent_count
+        return await self.publish(tenant_channel(tenant_id), message)
     
     async def broadcast(
         self,
@@ -269,16 +545,11 @@ class ConnectionManager:
         
         Returns the number of connections that received the message.
         """
-        sent_count = 0
-        
-        # Get all tenants
-        tenants = list(self.active_connections.keys())
-        
-        # Send message to each tenant
-        for tenant_id in tenants:
-            sent_count += await self.broadcast_to_tenant(tenant_id, message)
-        
-        return sent_count
+        # Copy the connections since failed sends disconnect them
+        return await self._send_to_many(
+            list(self._connections.values()),
+            encode_message(message)
+        )
     
     def get_connection_count(
         self,
@@ -292,31 +563,13 @@ class ConnectionManager:
         """
         if tenant_id is None:
             # Count all connections
-            return sum(
-                sum(
-                    len(clients)
-                    for clients in users.values()
-                )
-                for users in self.active_connections.values()
-            )
+            return self._total
         elif user_id is None:
             # Count connections for a specific tenant
-            if tenant_id not in self.active_connections:
-                return 0
-            
-            return sum(
-                len(clients)
-                for clients in self.active_connections[tenant_id].values()
-            )
+            return self._per_tenant.get(tenant_id, 0)
         else:
             # Count connections for a specific tenant and user
-            if (
-                tenant_id not in self.active_connections or
-                user_id not in self.active_connections[tenant_id]
-            ):
-                return 0
-            
-            return len(self.active_connections[tenant_id][user_id])
+            return self._per_user.get((tenant_id, user_id), 0)
     
     def get_connection_info(
         self,
@@ -327,83 +580,87 @@ class ConnectionManager:
         """
         Returns information about a specific connection.
         """
-        if (
-            tenant_id in self.active_connections and
-            user_id in self.active_connections[tenant_id] and
-            client_id in self.active_connections[tenant_id][user_id]
-        ):
-            connection_info = self.active_connections[tenant_id][user_id][client_id]
-            return connection_info.to_dict()
+        connection_info = self._connections.get((tenant_id, user_id, client_id))
+        if connection_info is None:
+            return None
+        
+        return connection_info.to_dict()
+    
+    async def _send_heartbeat(self) -> int:
+        """
+        Sends a heartbeat message to all connections.
+        
+        The heartbeat is encoded once and sent to all connections concurrently
+        in shards.
+        
+        Returns the number of connections that received the heartbeat.
+        """
+        payload = encode_message({
+            "type": "heartbeat",
+            "timestamp": int(time.time())
+        })
         
-        return None
+        return await self._send_to_many(list(self._connections.values()), payload)
     
-    async def _heartbeat_task(self) -> None:
+    async def _heartbeat_round(self) -> None:
         """
-        Background task to send heartbeat messages to all connections.
+        Sends one round of heartbeat messages to all connections.
         
         This helps keep connections alive and detect stale connections.
         """
-        while True:
-            try:
-                # Send heartbeat every 30 seconds
-                await asyncio.sleep(30)
-                
-                # Get current timestamp
-                timestamp = int(time.time())
-                
-                # Heartbeat message
-                heartbeat_message = {
-                    "type": "heartbeat",
-                    "timestamp": timestamp
-                }
-                
-                # Send heartbeat to all connections
-                await self.broadcast(heartbeat_message)
-                
-                logging.debug(f"Sent heartbeat to {self.get_connection_count()} connections")
-            except Exception as e:
-                logging.error(f"Error in heartbeat task: {str(e)}", exc_info=True)
+        # Send heartbeat to all connections
+        sent_count = await self._send_heartbeat()
+        
+        logging.debug(f"Sent heartbeat to {sent_count} connections")
     
-    async def _cleanup_task(self) -> None:
+    async def _cleanup_round(self) -> None:
         """
-        Background task to clean up stale connections.
+        Runs one round of stale connection cleanup.
         
         Removes connections that haven't had activity for more than 5 minutes.
         """
-        while True:
-            try:
-                # Run cleanup every 5 minutes
-                await asyncio.sleep(300)  # 5 minutes
-                
-                # Get current timestamp
-                now = datetime.now()
-                
-                # Find stale connections
-                stale_connections = []
-                
-                for tenant_id, users in self.active_connections.items():
-                    for user_id, clients in users.items():
-                        for client_id, connection_info in clients.items():
-                            # Check if connection is stale (inactive for more than 5 minutes)
-                            time_since_activity = (now - connection_info.last_activity_at).total_seconds()
-                            
-                            if time_since_activity > 300:  # 5 minutes
-                                stale_connections.append((tenant_id, user_id, client_id))
-                
-                # Disconnect stale connections
-                for tenant_id, user_id, client_id in stale_connections:
-                    logging.info(
-                        f"Cleaning up stale connection for tenant {tenant_id}, user {user_id}, client {client_id}",
-                        extra={
-                            "tenant_id": tenant_id,
-                            "user_id": user_id,
-                            "client_id": client_id
-                        }
+        # Pop heap entries older than the cutoff; connections that have
+        # been active since their entry was pushed are re-armed instead
+        cutoff = time.monotonic() - STALE_CONNECTION_TIMEOUT
+        stale_connections = []
+        
+        while self._activity_heap and self._activity_heap[0][0] < cutoff:
+            _, _, connection_info = heapq.heappop(self._activity_heap)
+            key = (
+                connection_info.tenant_id,
+                connection_info.user_id,
+                connection_info.client_id
+            )
+            
+            # Skip entries for connections that are already gone
+            if self._connections.get(key) is not connection_info:
+                continue
+            
+            if connection_info._last_activity_monotonic >= cutoff:
+                heapq.heappush(
+                    self._activity_heap,
+                    (
+                        connection_info._last_activity_monotonic,
+                        next(self._heap_seq),
+                        connection_info
                     )
-                    
-                    await self.disconnect(tenant_id, user_id, client_id)
-                
-                if stale_connections:
-                    logging.info(f"Cleaned up {len(stale_connections)} stale connections")
-            except Exception as e:
-                logging.error(f"Error in cleanup task: {str(e)}", exc_info=True)
\ No newline at end of file
+                )
+                continue
+            
+            stale_connections.append(key)
+        
+        # Disconnect stale connections
+        for tenant_id, user_id, client_id in stale_connections:
+            logging.info(
+                f"Cleaning up stale connection for tenant {tenant_id}, user {user_id}, client {client_id}",
+                extra={
+                    "tenant_id": tenant_id,
+                    "user_id": user_id,
+                    "client_id": client_id
+                }
+            )
+            
+            await self.disconnect(tenant_id, user_id, client_id)
+        
+        if stale_connections:
+            logging.info(f"Cleaned up {len(stale_connections)} stale connections")
\ No newline at end of file
@@ -8,14 +8,22 @@ concrete implementations for various messaging platforms.
 from app.channels.base import BaseChannel, ChannelConfig
 from app.channels.channel_factory import ChannelFactory
 
-# Import channel implementations for auto-registration
-from app.channels.whatsapp import WhatsAppChannel
+# Built-in channel types are resolved lazily from the channel manifest
+ChannelFactory.initialize()
 
-# Register built-in channel types with the factory
-ChannelFactory.register_channel("whatsapp", WhatsAppChannel)
+# Channel classes re-exported by this package -> their channel type. They are
+# resolved through the factory on first access, so importing the package does
+# not load any channel implementation.
+_LAZY_CHANNEL_CLASSES = {
+    'WhatsAppChannel': 'whatsapp',
+}
 
-# Initialize the factory to discover additional channel implementations
-ChannelFactory.initialize()
+
+def __getattr__(name: str):
+    channel_type = _LAZY_CHANNEL_CLASSES.get(name)
+    if channel_type is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return ChannelFactory._resolve_channel_class(channel_type)
 
 __all__ = [
     'BaseChannel',
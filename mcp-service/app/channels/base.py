@@ -2,7 +2,7 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional, Union
 import logging
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, ConfigDict, ValidationError
 
 from app.domain.models.message import Message
 from app.domain.schemas.message import MessageResponse
@@ -17,8 +17,7 @@ class ChannelConfig(BaseModel):
     tenant_id: str
     enabled: bool = True
     
-    class Config:
-        extra = "allow"  # Allow additional fields for channel-specific config
+    model_config = ConfigDict(extra="allow")  # Allow additional fields for channel-specific config
 
 
 class BaseChannel(ABC):
@@ -40,8 +39,10 @@ class BaseChannel(ABC):
         Raises:
             ChannelConfigError: If configuration validation fails
         """
+        self._closed = False
+        
         try:
-            self.config = config if isinstance(config, ChannelConfig) else ChannelConfig(**config)
+            self.config = config if isinstance(config, ChannelConfig) else ChannelConfig.model_validate(config)
             self.channel_id = self.config.channel_id
             self.tenant_id = self.config.tenant_id
             
@@ -69,7 +70,7 @@ class BaseChannel(ABC):
             raise ChannelConfigError(f"Channel initialization error: {str(e)}")
     
     @abstractmethod
-    def send_message(self, message: Union[Message, Dict[str, Any]]) -> Dict[str, Any]:
+    async def send_message(self, message: Union[Message, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Send message to the external channel.
         
@@ -160,4 +161,17 @@ class BaseChannel(ABC):
     
     def is_enabled(self) -> bool:
         """Check if the channel is enabled."""
-        return self.config.enabled
\ No newline at end of file
+        return self.config.enabled
+    
+    @property
+    def is_closed(self) -> bool:
+        """Check if the channel has been closed."""
+        return self._closed
+    
+    async def close(self) -> None:
+        """
+        Release resources held by the channel.
+        
+        Channels owning clients or background tasks extend this to release them.
+        """
+        self._closed = True
@@ -1,13 +1,21 @@
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
+import asyncio
 import importlib
 import inspect
+import json
+import time
 
 from app.utils.logger import get_logger
 from app.utils.exceptions import ChannelNotFoundError, ChannelRegistrationError
 from app.channels.base import BaseChannel
+from app.channels.channel_manifest import CHANNEL_MANIFEST
 
 logger = get_logger(__name__)
 
+# Idle lifetime and size bound for cached channel instances
+INSTANCE_CACHE_TTL = 300  # 5 minutes
+INSTANCE_CACHE_MAX_SIZE = 5000
+
 class ChannelFactory:
     """
     Factory for creating and managing channel instances.
@@ -20,6 +28,14 @@ class ChannelFactory:
     # Class-level registry of channel types to implementation classes
     _registry: Dict[str, Type[BaseChannel]] = {}
     
+    # Constructed channels keyed by (channel_type, tenant_id, config_hash),
+    # stored with the monotonic time they were last handed out
+    _instance_cache: Dict[Tuple[str, str, int], Tuple[float, BaseChannel]] = {}
+    
+    # Pending close() calls of dropped instances; the event loop only keeps
+    # weak references to tasks
+    _closing_tasks: Set[asyncio.Task] = set()
+    
     @classmethod
     def register_channel(cls, channel_type: str, channel_class: Type[BaseChannel]) -> None:
         """
@@ -44,6 +60,7 @@ class ChannelFactory:
             logger.warning(f"Overriding existing channel type: {channel_type}")
             
         cls._registry[channel_type] = channel_class
+        cls._evict_instances(channel_type)
         logger.info(f"Registered channel type: {channel_type} -> {channel_class.__name__}")
     
     @classmethod
@@ -51,6 +68,13 @@ class ChannelFactory:
         """
         Create a channel instance by type.
         
+        Instances are cached per channel type, tenant and configuration
+        until unused for INSTANCE_CACHE_TTL seconds, so repeated calls with
+        an unchanged configuration skip config validation and client setup.
+        Closed instances are never returned. Instances dropped from the cache
+        are not closed, since callers may still hold them; they release
+        their background resources once idle.
+        
         Args:
             channel_type: The type of channel to create
             config: Configuration dictionary for the channel
@@ -61,16 +85,139 @@ class ChannelFactory:
         Raises:
             ChannelNotFoundError: If channel type is not registered
         """
-        if channel_type not in cls._registry:
-            raise ChannelNotFoundError(f"Channel type not found: {channel_type}")
+        channel_class = cls._resolve_channel_class(channel_type)
+        
+        cache_key = cls._instance_cache_key(channel_type, config)
+        now = time.monotonic()
+        if cache_key is not None:
+            cached = cls._instance_cache.get(cache_key)
+            if cached is not None:
+                if now - cached[0] < INSTANCE_CACHE_TTL and not cached[1].is_closed:
+                    cls._instance_cache[cache_key] = (now, cached[1])
+                    return cached[1]
+                del cls._instance_cache[cache_key]
             
         try:
-            channel_class = cls._registry[channel_type]
             logger.debug(f"Creating channel instance: {channel_type}")
-            return channel_class(config)
+            channel = channel_class(config)
         except Exception as e:
             logger.error(f"Failed to create channel instance: {str(e)}")
             raise
+        
+        if cache_key is not None:
+            if len(cls._instance_cache) >= INSTANCE_CACHE_MAX_SIZE:
+                cls._purge_expired_instances(now)
+            if len(cls._instance_cache) < INSTANCE_CACHE_MAX_SIZE:
+                cls._instance_cache[cache_key] = (now, channel)
+        
+        return channel
+    
+    @staticmethod
+    def _instance_cache_key(
+        channel_type: str,
+        config: Dict[str, Any]
+    ) -> Optional[Tuple[str, str, int]]:
+        """
+        Build the instance cache key for a channel configuration.
+        
+        Args:
+            channel_type: The type of channel
+            config: Configuration dictionary for the channel
+            
+        Returns:
+            Cache key, or None if the configuration cannot be hashed
+        """
+        if not isinstance(config, dict):
+            return None
+        
+        try:
+            config_hash = hash(json.dumps(config, sort_keys=True, default=str))
+        except (TypeError, ValueError):
+            return None
+        
+        return (channel_type, str(config.get("tenant_id", "")), config_hash)
+    
+    @classmethod
+    def _purge_expired_instances(cls, now: float) -> None:
+        """
+        Drop cached channel instances unused for INSTANCE_CACHE_TTL.
+        
+        Args:
+            now: Current monotonic time
+        """
+        expired = [
+            key for key, (last_used_at, _) in cls._instance_cache.items()
+            if now - last_used_at >= INSTANCE_CACHE_TTL
+        ]
+        for key in expired:
+            del cls._instance_cache[key]
+    
+    @classmethod
+    def _evict_instances(cls, channel_type: str) -> None:
+        """
+        Drop and close all cached instances of a channel type.
+        
+        Called when the type's implementation is replaced, so instances of
+        the old implementation stop serving.
+        
+        Args:
+            channel_type: The channel type whose instances should be dropped
+        """
+        stale = [key for key in cls._instance_cache if key[0] == channel_type]
+        for key in stale:
+            cls._close_instance(cls._instance_cache.pop(key)[1])
+    
+    @classmethod
+    def _close_instance(cls, channel: BaseChannel) -> None:
+        """
+        Schedule close() of a channel instance dropped from the cache.
+        
+        Without a running event loop nothing is scheduled: channels only
+        start background tasks from within a loop.
+        
+        Args:
+            channel: The dropped channel instance
+        """
+        if channel.is_closed:
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        
+        task = loop.create_task(cls._close_quietly(channel))
+        cls._closing_tasks.add(task)
+        task.add_done_callback(cls._closing_tasks.discard)
+    
+    @classmethod
+    async def close_instances(cls) -> None:
+        """
+        Close every cached channel instance.
+        
+        Called on application shutdown.
+        """
+        channels = [channel for _, channel in cls._instance_cache.values()]
+        cls._instance_cache.clear()
+        for channel in channels:
+            if not channel.is_closed:
+                await cls._close_quietly(channel)
+        
+        if cls._closing_tasks:
+            await asyncio.gather(*cls._closing_tasks, return_exceptions=True)
+    
+    @staticmethod
+    async def _close_quietly(channel: BaseChannel) -> None:
+        """
+        Close a channel instance, logging instead of raising on failure.
+        
+        Args:
+            channel: The channel instance to close
+        """
+        try:
+            await channel.close()
+        except Exception as e:
+            logger.warning(f"Failed to close cached channel {channel}: {str(e)}")
     
     @classmethod
     def get_channel_types(cls) -> List[str]:
@@ -80,7 +227,7 @@ class ChannelFactory:
         Returns:
             List of registered channel type names
         """
-        return list(cls._registry.keys())
+        return list(dict.fromkeys([*cls._registry, *CHANNEL_MANIFEST]))
         
     @classmethod
     def get_channel_config(cls, channel_type: str) -> Dict[str, Any]:
@@ -99,14 +246,12 @@ class ChannelFactory:
         Raises:
             ChannelNotFoundError: If channel type is not registered
         """
-        if channel_type not in cls._registry:
-            raise ChannelNotFoundError(f"Channel type not found: {channel_type}")
-            
-        channel_class = cls._registry[channel_type]
+        channel_class = cls._resolve_channel_class(channel_type)
         
         # If the channel class has a CONFIG_SCHEMA class attribute, return it
         if hasattr(channel_class, 'CONFIG_SCHEMA'):
-            return channel_class.CONFIG_SCHEMA
+            # Copy so callers get a plain dict even if the class freezes its schema
+            return dict(channel_class.CONFIG_SCHEMA)
             
         # Otherwise, try to infer from the channel's __init__ method
         try:
@@ -132,66 +277,49 @@ class ChannelFactory:
             }
     
     @classmethod
-    def _discover_channels(cls, package_path: str = "app.channels") -> None:
+    def _resolve_channel_class(cls, channel_type: str) -> Type[BaseChannel]:
         """
-        Automatically discover and register channel implementations.
+        Get the implementation class for a channel type.
         
-        This method scans the specified package for channel implementations
-        and registers them with the factory.
+        Registered classes are returned directly. Built-in channels listed in
+        the channel manifest are imported on first use and then cached in the
+        registry.
         
         Args:
-            package_path: Module path to scan for channel implementations
+            channel_type: The channel type to resolve
+            
+        Returns:
+            The channel implementation class
+            
+        Raises:
+            ChannelNotFoundError: If channel type is neither registered nor in the manifest
         """
+        channel_class = cls._registry.get(channel_type)
+        if channel_class is not None:
+            return channel_class
+        
+        target = CHANNEL_MANIFEST.get(channel_type)
+        if target is None:
+            raise ChannelNotFoundError(f"Channel type not found: {channel_type}")
+        
+        module_path, class_name = target.split(":")
         try:
-            package = importlib.import_module(package_path)
-            
-            # Get the package directory
-            package_dir = getattr(package, '__path__', [None])[0]
-            if not package_dir:
-                logger.warning(f"Could not determine package directory for {package_path}")
-                return
-                
-            # Look through all modules in the package
-            for _, name, is_pkg in importlib.util.iter_modules([package_dir]):
-                # Skip __init__.py and base.py
-                if name in ['__init__', 'base', 'channel_factory']:
-                    continue
-                    
-                if is_pkg:
-                    # Recursively scan subpackages
-                    cls._discover_channels(f"{package_path}.{name}")
-                else:
-                    try:
-                        # Import the module
-                        module = importlib.import_module(f"{package_path}.{name}")
-                        
-                        # Look for classes that extend BaseChannel
-                        for attr_name in dir(module):
-                            attr = getattr(module, attr_name)
-                            
-                            if (inspect.isclass(attr) and 
-                                issubclass(attr, BaseChannel) and 
-                                attr != BaseChannel):
-                                
-                                # Generate a sensible channel type name
-                                channel_type = attr_name.lower()
-                                if channel_type.endswith('channel'):
-                                    channel_type = channel_type[:-7]  # Remove 'channel' suffix
-                                    
-                                cls.register_channel(channel_type, attr)
-                    except Exception as e:
-                        logger.warning(f"Error discovering channels in {name}: {str(e)}")
-        except Exception as e:
-            logger.error(f"Error during channel discovery: {str(e)}")
+            channel_class = getattr(importlib.import_module(module_path), class_name)
+        except (ImportError, AttributeError) as e:
+            raise ChannelRegistrationError(
+                f"Failed to load channel implementation {target}: {str(e)}"
+            )
+        
+        cls.register_channel(channel_type, channel_class)
+        return channel_class
     
     @classmethod
     def initialize(cls) -> None:
         """
         Initialize the channel factory.
         
-        This method should be called during application startup to discover
-        and register all available channel implementations.
+        Built-in channels are loaded lazily from the channel manifest, so this
+        only reports the channel types that are available.
         """
         logger.info("Initializing ChannelFactory")
-        cls._discover_channels()
         logger.info(f"Registered channel types: {cls.get_channel_types()}")
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+Static manifest of built-in channel implementations.
+
+Maps each channel type to the importable "module:Class" path of its
+implementation. The ChannelFactory imports an implementation only when a
+channel of that type is first requested, so unused channel modules are never
+loaded. Add an entry here when a new channel package is added under
+app.channels; running this module prints the manifest discovered from the
+package so it can be pasted in:
+
+    python -m app.channels.channel_manifest
+"""
+
+import importlib
+import inspect
+import pkgutil
+from typing import Dict
+
+CHANNEL_MANIFEST: Dict[str, str] = {
+    "whatsapp": "app.channels.whatsapp:WhatsAppChannel",
+}
+
+# Modules in the channels package that never contain channel implementations
+_SKIPPED_MODULES = {"base", "channel_factory", "channel_manifest"}
+
+
+def discover_channel_manifest(package_path: str = "app.channels") -> Dict[str, str]:
+    """
+    Scan a package for BaseChannel subclasses and build a manifest for them.
+    
+    This imports every module in the package, so it is meant to be run offline
+    when channels are added, not during application startup.
+    
+    Args:
+        package_path: Module path to scan for channel implementations
+        
+    Returns:
+        Dictionary mapping channel types to "module:Class" paths
+    """
+    from app.channels.base import BaseChannel
+    
+    package = importlib.import_module(package_path)
+    manifest: Dict[str, str] = {}
+    
+    for module_info in pkgutil.walk_packages(package.__path__, prefix=f"{package_path}."):
+        if module_info.ispkg or module_info.name.rsplit(".", 1)[-1] in _SKIPPED_MODULES:
+            continue
+        
+        module = importlib.import_module(module_info.name)
+        for attr_name, attr in inspect.getmembers(module, inspect.isclass):
+            # Only record classes defined in this module, not re-exports
+            if (issubclass(attr, BaseChannel) and
+                attr is not BaseChannel and
+                attr.__module__ == module.__name__):
+                
+                # Generate a sensible channel type name
+                channel_type = attr_name.lower()
+                if channel_type.endswith("channel"):
+                    channel_type = channel_type[:-7]  # Remove 'channel' suffix
+                
+                manifest[channel_type] = f"{module.__name__}:{attr_name}"
+    
+    return manifest
+
+
+if __name__ == "__main__":
+    for channel_type, target in sorted(discover_channel_manifest().items()):
+        print(f'    "{channel_type}": "{target}",')
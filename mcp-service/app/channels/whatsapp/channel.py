@@ -1,17 +1,34 @@
-from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field, HttpUrl, validator
-import json
-import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple, Union
+from pydantic import BaseModel, Field, HttpUrl, TypeAdapter, validator
+import asyncio
+import hashlib
+import hmac
+import logging
+import orjson
+import os
+from types import MappingProxyType
 
 from app.channels.base import BaseChannel, ChannelConfig
 from app.channels.whatsapp.client import WhatsAppClient
-from app.domain.models.message import Message
+from app.channels.whatsapp.schema import validate_webhook_payload
+from app.config import get_settings
+from app.domain.models.message import Message, WebhookBatch
 from app.domain.schemas.message import MessageResponse, MessageType
 from app.utils.exceptions import MessageProcessingError, ChannelConfigError
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum number of outbound messages waiting to be sent per channel
+SEND_QUEUE_MAX_SIZE = 1000
+
+# Outbound messages per second allowed for a single business phone number
+SEND_RATE_LIMIT = 20
+
+# Seconds the send queue may stay empty before its drain task exits; the
+# next enqueued message starts a new one
+SEND_QUEUE_IDLE_TIMEOUT = 60
+
 class WhatsAppChannelConfig(ChannelConfig):
     """WhatsApp specific channel configuration."""
     api_version: str = "v18.0"
@@ -29,6 +46,234 @@ class WhatsAppChannelConfig(ChannelConfig):
         return v
 
 
+# Build the config schema and its validator at import rather than on the
+# first channel instantiation
+WhatsAppChannelConfig.model_rebuild()
+_CONFIG_ADAPTER = TypeAdapter(WhatsAppChannelConfig)
+
+
+# Shared fallback for missing payload lists, so navigation does not allocate
+# a fresh [{}] per lookup. Its dict is read-only by convention.
+_EMPTY = ({},)
+
+
+def _new_message_id() -> str:
+    """
+    Generate an internal message ID.
+    
+    Returns:
+        32 hex characters of OS randomness, the same entropy as a UUID4
+        without the UUID object construction and formatting
+    """
+    return os.urandom(16).hex()
+
+
+# Message type values -> members, for callers that pass plain strings
+_MESSAGE_TYPES: Dict[str, MessageType] = {member.value: member for member in MessageType}
+
+
+def _as_message_type(message_type: Union[MessageType, str]) -> Union[MessageType, str]:
+    """
+    Resolve a message type given as a plain string to its MessageType member.
+    
+    Resolving once at entry means the formatted message always carries the
+    member, so later checks can compare by identity instead of going through
+    the str equality of the enum. Unknown values are returned unchanged.
+    """
+    if type(message_type) is MessageType:
+        return message_type
+    return _MESSAGE_TYPES.get(message_type, message_type)
+
+
+def _extract_message_data(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Navigate a webhook payload to its first message object.
+    
+    Args:
+        payload: Raw webhook payload from WhatsApp
+        
+    Returns:
+        The first message in the payload, or an empty dict if there is none
+    """
+    entry = (payload.get("entry") or _EMPTY)[0]
+    changes = (entry.get("changes") or _EMPTY)[0]
+    value = changes.get("value") or _EMPTY[0]
+    return (value.get("messages") or _EMPTY)[0]
+
+
+def _extract_text(data: Dict[str, Any]) -> Tuple[MessageType, Dict[str, Any]]:
+    return MessageType.TEXT, {
+        "text": data.get("body", "")
+    }
+
+
+def _extract_image(data: Dict[str, Any]) -> Tuple[MessageType, Dict[str, Any]]:
+    return MessageType.IMAGE, {
+        "media_type": "image",
+        "media_id": data.get("id", ""),
+        "mime_type": data.get("mime_type", ""),
+        "caption": data.get("caption", "")
+    }
+
+
+def _extract_audio(data: Dict[str, Any]) -> Tuple[MessageType, Dict[str, Any]]:
+    return MessageType.AUDIO, {
+        "media_type": "audio",
+        "media_id": data.get("id", ""),
+        "mime_type": data.get("mime_type", "")
+    }
+
+
+def _extract_video(data: Dict[str, Any]) -> Tuple[MessageType, Dict[str, Any]]:
+    return MessageType.VIDEO, {
+        "media_type": "video",
+        "media_id": data.get("id", ""),
+        "mime_type": data.get("mime_type", ""),
+        "caption": data.get("caption", "")
+    }
+
+
+def _extract_document(data: Dict[str, Any]) -> Tuple[MessageType, Dict[str, Any]]:
+    return MessageType.DOCUMENT, {
+        "media_type": "document",
+        "media_id": data.get("id", ""),
+        "mime_type": data.get("mime_type", ""),
+        "filename": data.get("filename", "")
+    }
+
+
+def _extract_location(data: Dict[str, Any]) -> Tuple[MessageType, Dict[str, Any]]:
+    return MessageType.LOCATION, {
+        "latitude": data.get("latitude", 0),
+        "longitude": data.get("longitude", 0),
+        "name": data.get("name", ""),
+        "address": data.get("address", "")
+    }
+
+
+def _extract_interactive(data: Dict[str, Any]) -> Tuple[MessageType, Dict[str, Any]]:
+    return MessageType.INTERACTIVE, {
+        "interactive_type": data.get("type", ""),
+        "interactive_data": data
+    }
+
+
+# Webhook message field -> extractor returning (message type, normalized content).
+# A WhatsApp message carries exactly one of these fields.
+_MEDIA_EXTRACTORS = {
+    "text": _extract_text,
+    "image": _extract_image,
+    "audio": _extract_audio,
+    "video": _extract_video,
+    "document": _extract_document,
+    "location": _extract_location,
+    "interactive": _extract_interactive,
+}
+
+
+def _send_text(channel: "WhatsAppChannel", formatted_message: Dict[str, Any]) -> Awaitable[Dict[str, Any]]:
+    return channel._send_text(
+        recipient_id=formatted_message.get('recipient_id'),
+        text=formatted_message.get('text', '')
+    )
+
+
+def _send_template(channel: "WhatsAppChannel", formatted_message: Dict[str, Any]) -> Awaitable[Dict[str, Any]]:
+    return channel._send_template(
+        recipient_id=formatted_message.get('recipient_id'),
+        template_name=formatted_message.get('template_name', ''),
+        template_data=formatted_message.get('template_data', {})
+    )
+
+
+def _send_media(channel: "WhatsAppChannel", formatted_message: Dict[str, Any]) -> Awaitable[Dict[str, Any]]:
+    return channel._send_media(
+        recipient_id=formatted_message.get('recipient_id'),
+        media_type=formatted_message.get('media_type', ''),
+        media_url=formatted_message.get('media_url', ''),
+        caption=formatted_message.get('caption', '')
+    )
+
+
+def _send_interactive(channel: "WhatsAppChannel", formatted_message: Dict[str, Any]) -> Awaitable[Dict[str, Any]]:
+    return channel._send_interactive(
+        recipient_id=formatted_message.get('recipient_id'),
+        interactive_data=formatted_message.get('interactive', {})
+    )
+
+
+# Message type -> client call for an already formatted message
+_SEND_DISPATCH: Dict[MessageType, Callable[["WhatsAppChannel", Dict[str, Any]], Awaitable[Dict[str, Any]]]] = {
+    MessageType.TEXT: _send_text,
+    MessageType.TEMPLATE: _send_template,
+    MessageType.IMAGE: _send_media,
+    MessageType.AUDIO: _send_media,
+    MessageType.VIDEO: _send_media,
+    MessageType.DOCUMENT: _send_media,
+    MessageType.INTERACTIVE: _send_interactive,
+}
+
+
+def _format_text(recipient_id: str, message_type: MessageType, content: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "recipient_id": recipient_id,
+        "type": message_type,
+        "text": content.get("text", "")
+    }
+
+
+def _format_template(recipient_id: str, message_type: MessageType, content: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "recipient_id": recipient_id,
+        "type": message_type,
+        "template_name": content.get("template_name", ""),
+        "template_data": content.get("template_data", {})
+    }
+
+
+def _format_media(recipient_id: str, message_type: MessageType, content: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "recipient_id": recipient_id,
+        "type": message_type,
+        "media_type": content.get("media_type", ""),
+        "media_url": content.get("media_url", ""),
+        "caption": content.get("caption", "")
+    }
+
+
+def _format_interactive(recipient_id: str, message_type: MessageType, content: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "recipient_id": recipient_id,
+        "type": message_type,
+        "interactive": content.get("interactive_data", {})
+    }
+
+
+def _format_location(recipient_id: str, message_type: MessageType, content: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "recipient_id": recipient_id,
+        "type": message_type,
+        "latitude": content.get("latitude", 0),
+        "longitude": content.get("longitude", 0),
+        "name": content.get("name", ""),
+        "address": content.get("address", "")
+    }
+
+
+# Message type -> function building the complete formatted message in a single
+# dict literal, so no base dict is built and then updated
+_FORMAT_DISPATCH: Dict[MessageType, Callable[[str, MessageType, Dict[str, Any]], Dict[str, Any]]] = {
+    MessageType.TEXT: _format_text,
+    MessageType.TEMPLATE: _format_template,
+    MessageType.IMAGE: _format_media,
+    MessageType.AUDIO: _format_media,
+    MessageType.VIDEO: _format_media,
+    MessageType.DOCUMENT: _format_media,
+    MessageType.INTERACTIVE: _format_interactive,
+    MessageType.LOCATION: _format_location,
+}
+
+
 class WhatsAppChannel(BaseChannel):
     """
     WhatsApp channel implementation.
@@ -38,18 +283,24 @@ class WhatsAppChannel(BaseChannel):
     """
     
     # Class-level configuration schema for registration
-    CONFIG_SCHEMA = {
+    CONFIG_SCHEMA = MappingProxyType({
         "type": "WhatsAppChannelConfig",
-        "required": ["phone_number_id", "business_account_id", "access_token"],
-        "optional": ["api_version", "webhook_secret", "base_url"]
-    }
+        "required": ("phone_number_id", "business_account_id", "access_token"),
+        "optional": ("api_version", "webhook_secret", "base_url")
+    })
     
-    def __init__(self, config: Union[Dict[str, Any], WhatsAppChannelConfig]):
+    def __init__(
+        self,
+        config: Union[Dict[str, Any], WhatsAppChannelConfig],
+        trusted: bool = False
+    ):
         """
         Initialize WhatsApp channel with configuration.
         
         Args:
             config: Configuration for the WhatsApp channel
+            trusted: Whether a config dict comes from an internal source that
+                     has already been validated, in which case validation is skipped
             
         Raises:
             ChannelConfigError: If configuration is invalid
@@ -57,7 +308,7 @@ class WhatsAppChannel(BaseChannel):
         try:
             # Convert dict to WhatsAppChannelConfig if needed
             if isinstance(config, dict):
-                config = WhatsAppChannelConfig(**config)
+                config = self._build_config(config, trusted)
                 
             # Initialize base class
             super().__init__(config)
@@ -65,6 +316,11 @@ class WhatsAppChannel(BaseChannel):
             # Store the typed config for WhatsApp-specific fields
             self.whatsapp_config = config
             
+            # Outbound send queue, created with its drain task on first use
+            # since the channel may be constructed outside an event loop
+            self._send_queue: Optional[asyncio.Queue] = None
+            self._drain_task: Optional[asyncio.Task] = None
+            
             # Initialize the WhatsApp client
             self.client = WhatsAppClient(
                 base_url=str(self.whatsapp_config.base_url),
@@ -73,14 +329,47 @@ class WhatsAppChannel(BaseChannel):
                 access_token=self.whatsapp_config.access_token
             )
             
+            # Bind client methods and config fields used on every send/receive
+            self._send_text = self.client.send_text
+            self._send_template = self.client.send_template
+            self._send_media = self.client.send_media
+            self._send_interactive = self.client.send_interactive
+            self._phone_number_id = self.whatsapp_config.phone_number_id
+            self._webhook_secret = self.whatsapp_config.webhook_secret
+            self._webhook_secret_key = (self._webhook_secret or "").encode()
+            
+            # Whether normalized messages keep a serialized copy of the webhook
+            self._store_raw_payload = get_settings().channel.STORE_RAW_PAYLOAD
+            
             logger.info(
-                f"WhatsApp channel initialized for phone number ID: {self.whatsapp_config.phone_number_id}",
+                "WhatsApp channel initialized for phone number ID: %s",
+                self.whatsapp_config.phone_number_id,
                 extra={"tenant_id": self.tenant_id, "channel_id": self.channel_id}
             )
         except Exception as e:
             logger.error(f"Failed to initialize WhatsApp channel: {str(e)}")
             raise ChannelConfigError(f"WhatsApp channel initialization error: {str(e)}")
     
+    @classmethod
+    def _build_config(cls, config: Dict[str, Any], trusted: bool) -> WhatsAppChannelConfig:
+        """
+        Build a WhatsAppChannelConfig from a config dictionary.
+        
+        Channels are reused through the ChannelFactory instance cache, so a
+        config is validated once per channel instance rather than per call.
+        
+        Args:
+            config: Configuration dictionary
+            trusted: Whether to skip validation for an internally sourced config
+            
+        Returns:
+            WhatsAppChannelConfig instance
+        """
+        if trusted:
+            return WhatsAppChannelConfig.model_construct(**config)
+        
+        return _CONFIG_ADAPTER.validate_python(config)
+    
     def validate_config(self) -> bool:
         """
         Validate WhatsApp channel configuration.
@@ -94,25 +383,18 @@ class WhatsAppChannel(BaseChannel):
         # Call base validation
         super().validate_config()
         
-        # WhatsApp-specific validation
-        try:
-            # Validate WhatsApp config
-            if not hasattr(self, 'whatsapp_config'):
-                self.whatsapp_config = WhatsAppChannelConfig(**self.config.dict())
-                
-            # Test WhatsApp client connection
-            logger.info("Testing WhatsApp client connection...")
-            if hasattr(self, 'client'):
-                # Optionally perform a lightweight API call to verify credentials
-                # self.client.test_connection()
-                pass
-                
-            return True
-        except Exception as e:
-            logger.error(f"WhatsApp configuration validation failed: {str(e)}")
-            raise ChannelConfigError(f"Invalid WhatsApp configuration: {str(e)}")
+        # WhatsApp-specific validation. The config is validated (or trusted)
+        # when it is built in __init__, so only its type needs checking here;
+        # rebuilding it from .dict() would re-run validation for nothing.
+        if not isinstance(self.config, WhatsAppChannelConfig):
+            logger.error("WhatsApp configuration validation failed: config is not a WhatsAppChannelConfig")
+            raise ChannelConfigError("Invalid WhatsApp configuration: expected a WhatsAppChannelConfig")
+        
+        # validate_config runs from BaseChannel.__init__, before the client is
+        # created, so credential checks against the API belong after setup
+        return True
     
-    def send_message(self, message: Union[Message, Dict[str, Any]]) -> Dict[str, Any]:
+    async def send_message(self, message: Union[Message, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Send message to WhatsApp API.
         
@@ -126,63 +408,10 @@ class WhatsAppChannel(BaseChannel):
             MessageProcessingError: If message sending fails
         """
         try:
-            # Convert to Message object if needed
-            if isinstance(message, dict):
-                # In a real implementation, you'd convert the dict to a Message object
-                # This is simplified for the example
-                pass
-                
-            # Format the message for WhatsApp
-            formatted_message = self.format_response(message)
-            
-            # Determine message type and call appropriate client method
-            message_type = message.message_type if hasattr(message, 'message_type') else formatted_message.get('type', 'text')
-            recipient_id = formatted_message.get('recipient_id')
-            
-            response = None
-            
-            if message_type == MessageType.TEXT:
-                response = self.client.send_text(
-                    recipient_id=recipient_id,
-                    text=formatted_message.get('text', '')
-                )
-            elif message_type == MessageType.TEMPLATE:
-                response = self.client.send_template(
-                    recipient_id=recipient_id,
-                    template_name=formatted_message.get('template_name', ''),
-                    template_data=formatted_message.get('template_data', {})
-                )
-            elif message_type == MessageType.MEDIA:
-                response = self.client.send_media(
-                    recipient_id=recipient_id,
-                    media_type=formatted_message.get('media_type', ''),
-                    media_url=formatted_message.get('media_url', ''),
-                    caption=formatted_message.get('caption', '')
-                )
-            elif message_type == MessageType.INTERACTIVE:
-                response = self.client.send_interactive(
-                    recipient_id=recipient_id,
-                    interactive_data=formatted_message.get('interactive', {})
-                )
-            else:
-                raise MessageProcessingError(f"Unsupported message type: {message_type}")
-                
-            logger.info(
-                f"Message sent to WhatsApp recipient: {recipient_id}",
-                extra={
-                    "tenant_id": self.tenant_id,
-                    "channel_id": self.channel_id,
-                    "message_type": message_type
-                }
-            )
-            
-            return {
-                "channel_message_id": response.get("messages", [{}])[0].get("id", ""),
-                "status": "sent",
-                "recipient_id": recipient_id,
-                "timestamp": response.get("timestamp", ""),
-                "raw_response": response
-            }
+            # Pick the path for the message shape once
+            if isinstance(message, Mapping):
+                return await self._send_from_dict(message)
+            return await self._send_from_message(message)
         except Exception as e:
             logger.error(
                 f"Failed to send WhatsApp message: {str(e)}",
@@ -190,12 +419,174 @@ class WhatsAppChannel(BaseChannel):
             )
             raise MessageProcessingError(f"WhatsApp message sending error: {str(e)}")
     
-    def receive_message(self, payload: Dict[str, Any]) -> Message:
+    async def _send_from_message(self, message: Union[Message, MessageResponse]) -> Dict[str, Any]:
+        """
+        Send a Message or MessageResponse object.
+        """
+        return await self._send_formatted(self._format_from_message(message))
+    
+    async def _send_from_dict(self, message: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Send a message given as a dictionary.
+        """
+        return await self._send_formatted(self._format_from_dict(message))
+    
+    async def _send_formatted(self, formatted_message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send an already formatted message through the matching client call.
+        
+        Args:
+            formatted_message: Output of format_response
+            
+        Returns:
+            Dictionary containing information about the sent message
+            
+        Raises:
+            MessageProcessingError: If the message type cannot be sent
+        """
+        message_type = formatted_message["type"]
+        recipient_id = formatted_message["recipient_id"]
+        
+        handler = _SEND_DISPATCH.get(message_type)
+        if handler is None:
+            raise MessageProcessingError(f"Unsupported message type: {message_type}")
+        
+        response = await handler(self, formatted_message)
+            
+        logger.info(
+            "Message sent to WhatsApp recipient: %s",
+            recipient_id,
+            extra={
+                "tenant_id": self.tenant_id,
+                "channel_id": self.channel_id,
+                "message_type": message_type
+            }
+        )
+        
+        return {
+            "channel_message_id": (response.get("messages") or _EMPTY)[0].get("id", ""),
+            "status": "sent",
+            "recipient_id": recipient_id,
+            "timestamp": response.get("timestamp", ""),
+            "raw_response": response
+        }
+    
+    async def enqueue_message(self, message: Union[Message, Dict[str, Any]]) -> "asyncio.Future[Dict[str, Any]]":
+        """
+        Queue a message for sending without waiting for the WhatsApp API.
+        
+        Messages are sent in order by a background task, paced to the
+        per-number rate limit.
+        
+        Args:
+            message: Message to send, either as a Message object or dictionary
+            
+        Returns:
+            Future resolving to the send_message result
+            
+        Raises:
+            MessageProcessingError: If the send queue is full
+        """
+        if self._send_queue is None:
+            self._send_queue = asyncio.Queue(maxsize=SEND_QUEUE_MAX_SIZE)
+        if self._drain_task is None:
+            self._drain_task = asyncio.create_task(self._drain_loop())
+        
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._send_queue.put_nowait((message, future))
+        except asyncio.QueueFull:
+            logger.warning(
+                "WhatsApp send queue is full",
+                extra={"tenant_id": self.tenant_id, "channel_id": self.channel_id}
+            )
+            raise MessageProcessingError("WhatsApp send queue is full, retry later")
+        
+        return future
+    
+    async def _drain_loop(self) -> None:
+        """
+        Background task that sends queued messages at the allowed rate.
+        
+        Exits once the queue has been empty for SEND_QUEUE_IDLE_TIMEOUT
+        seconds, so a channel that is no longer used, for example after
+        being dropped from the ChannelFactory cache, holds no running task.
+        """
+        loop = asyncio.get_running_loop()
+        interval = 1.0 / SEND_RATE_LIMIT
+        next_send_at = loop.time()
+        
+        while True:
+            try:
+                message, future = await asyncio.wait_for(
+                    self._send_queue.get(), SEND_QUEUE_IDLE_TIMEOUT
+                )
+            except TimeoutError:
+                # Nothing can be enqueued between this check and returning,
+                # so enqueue_message starts a new task when needed
+                self._drain_task = None
+                return
+            try:
+                delay = next_send_at - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                next_send_at = max(next_send_at, loop.time()) + interval
+                
+                result = await self.send_message(message)
+            except asyncio.CancelledError:
+                # close() only fails messages still queued; fail this one too
+                if not future.done():
+                    future.set_exception(MessageProcessingError("WhatsApp channel closed"))
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self._send_queue.task_done()
+    
+    async def close(self) -> None:
+        """
+        Stop the send queue drain task and close the WhatsApp client.
+        
+        Messages still waiting in the queue are failed.
+        """
+        await super().close()
+        
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            self._drain_task = None
+        
+        if self._send_queue is not None:
+            while not self._send_queue.empty():
+                _, future = self._send_queue.get_nowait()
+                if not future.done():
+                    future.set_exception(MessageProcessingError("WhatsApp channel closed"))
+            self._send_queue = None
+        
+        await self.client.aclose()
+    
+    def receive_message(
+        self,
+        payload: Union[Dict[str, Any], bytes],
+        raw_body: Optional[bytes] = None,
+        signature: Optional[str] = None
+    ) -> Message:
         """
         Process incoming WhatsApp message.
         
         Args:
-            payload: Raw webhook payload from WhatsApp
+            payload: Raw webhook payload from WhatsApp, either parsed or as
+                     the undecoded request body
+            raw_body: Exact request body bytes, used for signature verification
+                      (defaults to payload when payload is bytes)
+            signature: Value of the X-Hub-Signature-256 header
             
         Returns:
             Normalized Message object
@@ -204,18 +595,29 @@ class WhatsAppChannel(BaseChannel):
             MessageProcessingError: If message processing fails
         """
         try:
-            logger.debug(
-                "Received WhatsApp webhook payload",
-                extra={
-                    "tenant_id": self.tenant_id,
-                    "channel_id": self.channel_id
-                }
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Received WhatsApp webhook payload",
+                    extra={
+                        "tenant_id": self.tenant_id,
+                        "channel_id": self.channel_id
+                    }
+                )
             
-            # Verify webhook signature if configured
-            if self.whatsapp_config.webhook_secret:
-                # In a real implementation, you'd verify the webhook signature here
-                pass
+            if raw_body is None and isinstance(payload, (bytes, bytearray, memoryview)):
+                raw_body = payload
+            
+            # Verify webhook signature if configured; this must hash the bytes
+            # exactly as received, before any parsing
+            if self._webhook_secret:
+                self._verify_signature(raw_body, signature)
+            
+            # Parse the raw request body if it was not decoded upstream
+            if isinstance(payload, (bytes, bytearray, memoryview, str)):
+                payload = orjson.loads(payload)
+            
+            # Reject payloads that do not have the webhook structure
+            validate_webhook_payload(payload)
                 
             # Normalize the message
             return self.normalize_message(payload)
@@ -226,6 +628,24 @@ class WhatsAppChannel(BaseChannel):
             )
             raise MessageProcessingError(f"WhatsApp webhook processing error: {str(e)}")
     
+    def _verify_signature(self, raw_body: Optional[bytes], signature: Optional[str]) -> None:
+        """
+        Verify the X-Hub-Signature-256 HMAC of a webhook body.
+        
+        Args:
+            raw_body: Exact request body bytes
+            signature: Signature header value, "sha256=<hex digest>"
+            
+        Raises:
+            MessageProcessingError: If the body or signature is missing or does not match
+        """
+        if raw_body is None or not signature:
+            raise MessageProcessingError("Missing webhook body or signature")
+        
+        expected = hmac.new(self._webhook_secret_key, raw_body, hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(expected, signature.removeprefix("sha256=")):
+            raise MessageProcessingError("Invalid webhook signature")
+    
     def normalize_message(self, payload: Dict[str, Any]) -> Message:
         """
         Convert WhatsApp message format to internal Message model.
@@ -240,11 +660,7 @@ class WhatsAppChannel(BaseChannel):
             MessageProcessingError: If normalization fails
         """
         try:
-            # Extract top-level data from webhook payload
-            entry = payload.get("entry", [{}])[0]
-            changes = entry.get("changes", [{}])[0]
-            value = changes.get("value", {})
-            message_data = value.get("messages", [{}])[0]
+            message_data = _extract_message_data(payload)
             
             # Extract message metadata
             sender_id = message_data.get("from", "")
@@ -255,74 +671,29 @@ class WhatsAppChannel(BaseChannel):
             message_type = MessageType.TEXT  # Default
             content = {}
             
-            if "text" in message_data:
-                message_type = MessageType.TEXT
-                content = {
-                    "text": message_data["text"].get("body", "")
-                }
-            elif "image" in message_data:
-                message_type = MessageType.MEDIA
-                content = {
-                    "media_type": "image",
-                    "media_id": message_data["image"].get("id", ""),
-                    "mime_type": message_data["image"].get("mime_type", ""),
-                    "caption": message_data["image"].get("caption", "")
-                }
-            elif "audio" in message_data:
-                message_type = MessageType.MEDIA
-                content = {
-                    "media_type": "audio",
-                    "media_id": message_data["audio"].get("id", ""),
-                    "mime_type": message_data["audio"].get("mime_type", "")
-                }
-            elif "video" in message_data:
-                message_type = MessageType.MEDIA
-                content = {
-                    "media_type": "video",
-                    "media_id": message_data["video"].get("id", ""),
-                    "mime_type": message_data["video"].get("mime_type", ""),
-                    "caption": message_data["video"].get("caption", "")
-                }
-            elif "document" in message_data:
-                message_type = MessageType.MEDIA
-                content = {
-                    "media_type": "document",
-                    "media_id": message_data["document"].get("id", ""),
-                    "mime_type": message_data["document"].get("mime_type", ""),
-                    "filename": message_data["document"].get("filename", "")
-                }
-            elif "location" in message_data:
-                message_type = MessageType.LOCATION
-                content = {
-                    "latitude": message_data["location"].get("latitude", 0),
-                    "longitude": message_data["location"].get("longitude", 0),
-                    "name": message_data["location"].get("name", ""),
-                    "address": message_data["location"].get("address", "")
-                }
-            elif "interactive" in message_data:
-                message_type = MessageType.INTERACTIVE
-                interactive_data = message_data["interactive"]
-                content = {
-                    "interactive_type": interactive_data.get("type", ""),
-                    "interactive_data": interactive_data
-                }
+            for key in message_data.keys() & _MEDIA_EXTRACTORS.keys():
+                message_type, content = _MEDIA_EXTRACTORS[key](message_data[key])
+                break
             
-            # Create a new Message object
-            message = Message(
-                message_id=str(uuid.uuid4()),  # Generate internal message ID
+            # Create a new Message object; every field is built above from the
+            # schema-checked webhook, so __init__ defaulting is skipped
+            message = Message.construct(
+                message_id=_new_message_id(),  # Generate internal message ID
                 channel_message_id=channel_message_id,
                 channel_id=self.channel_id,
                 tenant_id=self.tenant_id,
                 sender_id=sender_id,
-                recipient_id=self.whatsapp_config.phone_number_id,  # Business phone number
+                recipient_id=self._phone_number_id,  # Business phone number
                 message_type=message_type,
                 content=content,
                 timestamp=timestamp,
-                raw_payload=payload  # Store original payload for reference
+                # Original payload is only kept when enabled, as bytes rather than nested dicts
+                raw_payload=orjson.dumps(payload) if self._store_raw_payload else None
             )
             
             logger.info(
-                f"Normalized WhatsApp message from {sender_id}",
+                "Normalized WhatsApp message from %s",
+                sender_id,
                 extra={
                     "tenant_id": self.tenant_id,
                     "channel_id": self.channel_id,
@@ -339,7 +710,68 @@ class WhatsAppChannel(BaseChannel):
             )
             raise MessageProcessingError(f"WhatsApp message normalization error: {str(e)}")
     
-    def format_response(self, message: Union[Message, MessageResponse]) -> Dict[str, Any]:
+    def normalize_messages_batch(self, payloads: List[Dict[str, Any]]) -> WebhookBatch:
+        """
+        Normalize every message in a list of webhook payloads into one batch.
+        
+        Unlike normalize_message, this walks all entries, changes and messages
+        of each payload rather than only the first message.
+        
+        Args:
+            payloads: Raw webhook payloads from WhatsApp
+            
+        Returns:
+            Column-wise batch of the normalized messages
+            
+        Raises:
+            MessageProcessingError: If normalization fails
+        """
+        batch = WebhookBatch(tenant_id=self.tenant_id, channel_id=self.channel_id)
+        
+        # Bind the column appends once for the loop
+        add_message_id = batch.message_ids.append
+        add_channel_message_id = batch.channel_message_ids.append
+        add_sender_id = batch.sender_ids.append
+        add_timestamp = batch.timestamps.append
+        add_message_type = batch.message_types.append
+        add_content = batch.contents.append
+        
+        try:
+            for payload in payloads:
+                for entry in payload.get("entry") or ():
+                    for change in entry.get("changes") or ():
+                        value = change.get("value") or _EMPTY[0]
+                        for message_data in value.get("messages") or ():
+                            message_type = MessageType.TEXT  # Default
+                            content = {}
+                            
+                            for key in message_data.keys() & _MEDIA_EXTRACTORS.keys():
+                                message_type, content = _MEDIA_EXTRACTORS[key](message_data[key])
+                                break
+                            
+                            add_message_id(_new_message_id())
+                            add_channel_message_id(message_data.get("id", ""))
+                            add_sender_id(message_data.get("from", ""))
+                            add_timestamp(message_data.get("timestamp", ""))
+                            add_message_type(message_type)
+                            add_content(content)
+        except Exception as e:
+            logger.error(
+                f"Failed to normalize WhatsApp webhook batch: {str(e)}",
+                extra={"tenant_id": self.tenant_id, "channel_id": self.channel_id}
+            )
+            raise MessageProcessingError(f"WhatsApp batch normalization error: {str(e)}")
+        
+        logger.info(
+            "Normalized %d WhatsApp messages from %d webhooks",
+            len(batch),
+            len(payloads),
+            extra={"tenant_id": self.tenant_id, "channel_id": self.channel_id}
+        )
+        
+        return batch
+    
+    def format_response(self, message: Union[Message, MessageResponse, Mapping[str, Any]]) -> Dict[str, Any]:
         """
         Format internal message for WhatsApp delivery format.
         
@@ -353,52 +785,59 @@ class WhatsAppChannel(BaseChannel):
             MessageProcessingError: If formatting fails
         """
         try:
-            # Extract message data
-            content = message.content if hasattr(message, 'content') else {}
-            recipient_id = message.recipient_id if hasattr(message, 'recipient_id') else ""
-            message_type = message.message_type if hasattr(message, 'message_type') else MessageType.TEXT
-            
-            # Base message structure
-            formatted_message = {
-                "recipient_id": recipient_id,
-                "type": message_type
-            }
-            
-            # Format based on message type
-            if message_type == MessageType.TEXT:
-                formatted_message["text"] = content.get("text", "")
-            
-            elif message_type == MessageType.TEMPLATE:
-                formatted_message.update({
-                    "template_name": content.get("template_name", ""),
-                    "template_data": content.get("template_data", {})
-                })
-            
-            elif message_type == MessageType.MEDIA:
-                formatted_message.update({
-                    "media_type": content.get("media_type", ""),
-                    "media_url": content.get("media_url", ""),
-                    "caption": content.get("caption", "")
-                })
-            
-            elif message_type == MessageType.INTERACTIVE:
-                formatted_message.update({
-                    "interactive": content.get("interactive_data", {})
-                })
-            
-            elif message_type == MessageType.LOCATION:
-                formatted_message.update({
-                    "latitude": content.get("latitude", 0),
-                    "longitude": content.get("longitude", 0),
-                    "name": content.get("name", ""),
-                    "address": content.get("address", "")
-                })
+            # Pick the path for the message shape once
+            if isinstance(message, Mapping):
+                return self._format_from_dict(message)
+            return self._format_from_message(message)
+        except Exception as e:
+            logger.error(
+                f"Failed to format message for WhatsApp: {str(e)}",
+                extra={"tenant_id": self.tenant_id, "channel_id": self.channel_id}
+            )
+            raise MessageProcessingError(f"WhatsApp message formatting error: {str(e)}")
+    
+    def _format_from_message(self, message: Union[Message, MessageResponse]) -> Dict[str, Any]:
+        """
+        Format a Message or MessageResponse; both always carry these fields.
+        """
+        return self._build_formatted(
+            message.recipient_id,
+            _as_message_type(message.message_type),
+            message.content
+        )
+    
+    def _format_from_dict(self, message: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Format a message given as a dictionary, filling in defaults for missing fields.
+        """
+        return self._build_formatted(
+            message.get("recipient_id", ""),
+            _as_message_type(message.get("message_type", MessageType.TEXT)),
+            message.get("content") or {}
+        )
+    
+    def _build_formatted(
+        self,
+        recipient_id: str,
+        message_type: MessageType,
+        content: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Build the WhatsApp payload for a message's recipient, type and content.
+        
+        Raises:
+            MessageProcessingError: If the message type is not supported
+        """
+        # Format based on message type
+        builder = _FORMAT_DISPATCH.get(message_type)
+        if builder is None:
+            raise MessageProcessingError(f"Unsupported message type for WhatsApp: {message_type}")
+        
+        formatted_message = builder(recipient_id, message_type, content)
             
-            else:
-                raise MessageProcessingError(f"Unsupported message type for WhatsApp: {message_type}")
-                
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"Formatted message for WhatsApp delivery",
+                "Formatted message for WhatsApp delivery",
                 extra={
                     "tenant_id": self.tenant_id,
                     "channel_id": self.channel_id,
@@ -406,11 +845,5 @@ class WhatsAppChannel(BaseChannel):
                     "recipient_id": recipient_id
                 }
             )
-            
-            return formatted_message
-        except Exception as e:
-            logger.error(
-                f"Failed to format message for WhatsApp: {str(e)}",
-                extra={"tenant_id": self.tenant_id, "channel_id": self.channel_id}
-            )
-            raise MessageProcessingError(f"WhatsApp message formatting error: {str(e)}")
\ No newline at end of file
+        
+        return formatted_message
\ No newline at end of file
@@ -1,8 +1,15 @@
-import json
+import asyncio
+import importlib.util
+import logging
+import math
+import random
 import time
-from typing import Any, Dict, List, Optional, Union
-import requests
-from requests.exceptions import RequestException, Timeout, ConnectionError
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import httpx
+import orjson
 
 from app.utils.exceptions import (
     APIConnectionError,
@@ -11,10 +18,303 @@ from app.utils.exceptions import (
     APIRateLimitError
 )
 from app.utils.logger import get_logger
-from app.utils.retry import retry_with_backoff
 
 logger = get_logger(__name__)
 
+# Connection pool limits for the Graph API session shared by all tenants
+MAX_CONNECTIONS = 512
+MAX_KEEPALIVE_CONNECTIONS = 64
+KEEPALIVE_EXPIRY = 120
+
+# HTTP/2 lets concurrent sends share one TLS connection; it needs the h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Seconds a successful authenticate() result is reused before checking again
+AUTH_CACHE_TTL = 300
+
+# Static fields of outbound message payloads, built once and spread into each
+# payload. They are never mutated; every send builds a new top-level dict.
+_MESSAGE_SKELETON = {
+    "messaging_product": "whatsapp",
+    "recipient_type": "individual"
+}
+_TEXT_SKELETON = {**_MESSAGE_SKELETON, "type": "text"}
+_TEMPLATE_SKELETON = {**_MESSAGE_SKELETON, "type": "template"}
+_INTERACTIVE_SKELETON = {**_MESSAGE_SKELETON, "type": "interactive"}
+
+# Accepted media and interactive message types, and the media types that carry a caption
+_VALID_MEDIA = frozenset(("image", "video", "audio", "document"))
+_MEDIA_WITH_CAPTION = frozenset(("image", "video", "document"))
+_VALID_INTERACTIVE = frozenset(("button", "list", "product", "product_list"))
+
+def _build_text_param(param_data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "type": "text",
+        "text": param_data.get("text", "")
+    }
+
+
+def _build_image_param(param_data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "type": "image",
+        "image": {
+            "link": param_data.get("link", "")
+        }
+    }
+
+
+def _build_document_param(param_data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "type": "document",
+        "document": {
+            "link": param_data.get("link", ""),
+            "filename": param_data.get("filename", "")
+        }
+    }
+
+
+def _build_video_param(param_data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "type": "video",
+        "video": {
+            "link": param_data.get("link", "")
+        }
+    }
+
+
+def _build_location_param(param_data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "type": "location",
+        "location": {
+            "latitude": param_data.get("latitude", 0),
+            "longitude": param_data.get("longitude", 0),
+            "name": param_data.get("name", ""),
+            "address": param_data.get("address", "")
+        }
+    }
+
+
+def _build_default_param(param_data: Dict[str, Any]) -> Dict[str, Any]:
+    # Unknown parameter types are sent as text
+    return {
+        "type": "text",
+        "text": str(param_data.get("value", ""))
+    }
+
+
+# Template parameter type -> builder for its API representation
+_PARAM_BUILDERS = {
+    "text": _build_text_param,
+    "image": _build_image_param,
+    "document": _build_document_param,
+    "video": _build_video_param,
+    "location": _build_location_param,
+}
+
+# Maximum concurrent requests per client for batch sends
+BATCH_SEND_CONCURRENCY = 32
+
+
+def _extract_message_id(body: bytes) -> Optional[str]:
+    """
+    Extract the sent message's ID from a /messages response body.
+    
+    Batch sends keep only this ID per message, so the rest of each parsed
+    response is released straight away instead of being held until the
+    whole batch has finished.
+    
+    Args:
+        body: Raw response body
+        
+    Returns:
+        WhatsApp message ID, or None if the response has none
+    """
+    messages = orjson.loads(body).get("messages")
+    return messages[0].get("id") if messages else None
+
+
+# Backoff bounds in seconds for retried connection failures
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+# Seconds to wait after a 429 that carries no usable Retry-After header
+DEFAULT_RETRY_AFTER = 60
+
+
+def _parse_retry_after(value: Optional[str], default: int = DEFAULT_RETRY_AFTER) -> int:
+    """
+    Parse a Retry-After header into whole seconds.
+
+    The header is either a number of seconds or an HTTP-date; the numeric
+    form is by far the most common and is handled without the date parser.
+
+    Args:
+        value: Raw header value, or None if absent
+        default: Seconds to return when the header is missing or malformed
+
+    Returns:
+        Non-negative number of seconds to wait
+    """
+    if value is None:
+        return default
+    if value.isdigit():
+        return int(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0, int((retry_at - datetime.now(timezone.utc)).total_seconds()))
+
+
+# Transport errors raised before a request was sent. Only these are retried
+# for non-GET requests: after sending, a failure may follow Graph having
+# accepted the message, and a retry would deliver it again.
+_UNSENT_REQUEST_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# Seconds a cached GET response stays valid, and the most entries kept per client
+RESPONSE_CACHE_TTL = 60
+RESPONSE_CACHE_MAX_SIZE = 256
+
+# Session shared by every WhatsAppClient, so all tenants reuse the same
+# keep-alive connections to the Graph API. Created on first use.
+_shared_session: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_session() -> httpx.AsyncClient:
+    """
+    Get the HTTP session shared by all WhatsApp clients.
+    
+    Returns:
+        The shared httpx.AsyncClient, created if needed
+    """
+    global _shared_session
+    if _shared_session is None or _shared_session.is_closed:
+        _shared_session = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY
+            ),
+            headers={"Content-Type": "application/json"}
+        )
+    return _shared_session
+
+
+async def close_shared_session() -> None:
+    """
+    Close the shared HTTP session and its pooled connections.
+    
+    Called on application shutdown.
+    """
+    global _shared_session
+    if _shared_session is not None:
+        await _shared_session.aclose()
+        _shared_session = None
+
+
+# 429 or 5xx responses within the window that open a phone number's circuit,
+# and how long it then stays open before a request is let through again
+CIRCUIT_FAILURE_THRESHOLD = 20
+CIRCUIT_FAILURE_WINDOW = 10
+CIRCUIT_OPEN_SECONDS = 30
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for the requests of one WhatsApp phone number.
+    
+    Opens after sustained throttling or server errors so a hot tenant stops
+    spending Graph API quota on requests that will be rejected anyway. Once
+    the open period ends the circuit is half-open: requests go through again,
+    the first success closes it and the first failure reopens it.
+    
+    All state changes are synchronous, so no lock is needed on the event loop.
+    """
+    
+    __slots__ = ("threshold", "window", "open_seconds", "_failures", "_window_start",
+                 "_open_until", "_half_open")
+    
+    def __init__(
+        self,
+        threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        window: float = CIRCUIT_FAILURE_WINDOW,
+        open_seconds: float = CIRCUIT_OPEN_SECONDS
+    ):
+        """
+        Initialize a closed circuit breaker.
+        
+        Args:
+            threshold: Failures within the window that open the circuit
+            window: Seconds over which failures are counted
+            open_seconds: Seconds the circuit stays open
+        """
+        self.threshold = threshold
+        self.window = window
+        self.open_seconds = open_seconds
+        self._failures = 0
+        self._window_start = 0.0
+        self._open_until = 0.0
+        self._half_open = False
+    
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent."""
+        return self._open_until <= time.monotonic()
+    
+    def remaining(self) -> int:
+        """Seconds until the circuit lets requests through again."""
+        return max(0, math.ceil(self._open_until - time.monotonic()))
+    
+    def record_success(self) -> None:
+        """Close the circuit after a successful response."""
+        self._failures = 0
+        self._half_open = False
+    
+    def record_failure(self) -> None:
+        """Count a throttled or failed response, opening the circuit if needed."""
+        now = time.monotonic()
+        if self._half_open:
+            # The trial request failed, so back off for another full period
+            self._open_until = now + self.open_seconds
+            return
+        
+        if now - self._window_start > self.window:
+            self._window_start = now
+            self._failures = 0
+        
+        self._failures += 1
+        if self._failures >= self.threshold:
+            self._open_until = now + self.open_seconds
+            self._failures = 0
+            self._half_open = True
+            logger.warning(
+                f"WhatsApp API circuit opened for {self.open_seconds}s after "
+                f"{self.threshold} failures in {self.window}s"
+            )
+
+
+# phone_number_id -> its circuit breaker, shared by every client of the number
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(phone_number_id: str) -> CircuitBreaker:
+    """
+    Get the circuit breaker for a phone number.
+    
+    Args:
+        phone_number_id: WhatsApp phone number ID
+        
+    Returns:
+        The phone number's circuit breaker, created if needed
+    """
+    breaker = _circuit_breakers.get(phone_number_id)
+    if breaker is None:
+        breaker = _circuit_breakers[phone_number_id] = CircuitBreaker()
+    return breaker
+
+
 class WhatsAppClient:
     """
     Client for WhatsApp Business API.
@@ -46,25 +346,62 @@ class WhatsAppClient:
         self.base_url = base_url.rstrip('/')
         self.api_version = api_version
         self.phone_number_id = phone_number_id
-        self.access_token = access_token
         self.timeout = timeout
         self.max_retries = max_retries
         
         # Construct API endpoint base
         self.api_endpoint = f"{self.base_url}/{self.api_version}/{self.phone_number_id}"
         
-        # Create session for connection pooling
-        self.session = requests.Session()
+        # Resolved URLs of the endpoints every client calls, so the common
+        # requests do not build a new URL string each time
+        self._endpoints = {
+            "/messages": f"{self.api_endpoint}/messages",
+            "/": f"{self.api_endpoint}/",
+        }
+        
+        # Monotonic time of the last successful authenticate(); the lock keeps
+        # concurrent callers from all probing the API when the cache expires
+        self._auth_verified_at: Optional[float] = None
+        self._auth_lock = asyncio.Lock()
         
-        # Default headers for all requests
-        self.session.headers.update({
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.access_token}"
-        })
+        # Also builds the per-request auth headers
+        self.access_token = access_token
+        
+        # Bounds in-flight requests of batch sends
+        self._send_semaphore = asyncio.Semaphore(BATCH_SEND_CONCURRENCY)
+        
+        # Opt-in cache of GET responses: (url, sorted params) -> (monotonic time, body),
+        # kept in least-recently-used order
+        self._response_cache: "OrderedDict[Tuple[str, Tuple], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        
+        # Short-circuits requests while the phone number is being throttled
+        self._breaker = get_circuit_breaker(phone_number_id)
+        
+        # Set by aclose(); the client is owned by its channel, not the GC
+        self._closed = False
         
         logger.info(f"WhatsApp client initialized for phone number ID: {phone_number_id}")
     
-    def authenticate(self) -> bool:
+    @property
+    def access_token(self) -> str:
+        """Access token used to authenticate API requests."""
+        return self._access_token
+    
+    @access_token.setter
+    def access_token(self, access_token: str) -> None:
+        # Credentials are per tenant, so they are sent per request rather than
+        # set on the shared session. The header dict is built once per token
+        # and reused by every request until the token is rotated.
+        self._access_token = access_token
+        self.headers = {"Authorization": f"Bearer {access_token}"}
+        self._auth_verified_at = None
+    
+    @property
+    def session(self) -> httpx.AsyncClient:
+        """The HTTP session shared by all WhatsApp clients."""
+        return get_shared_session()
+    
+    async def authenticate(self) -> bool:
         """
         Verify authentication credentials.
         
@@ -74,86 +411,203 @@ class WhatsAppClient:
         Raises:
             APIAuthenticationError: If authentication fails
         """
-        try:
-            # Make a lightweight call to verify credentials
-            # This is simplified for the example - typically you'd use a proper endpoint
-            response = self._make_request("GET", "/")
+        if self._auth_is_cached():
             return True
-        except APIAuthenticationError:
-            raise
-        except Exception as e:
-            logger.error(f"Authentication failed: {str(e)}")
-            raise APIAuthenticationError(f"Failed to authenticate: {str(e)}")
-    
-    @retry_with_backoff(
-        retries=3,
-        backoff_factor=2,
-        retry_exceptions=(Timeout, ConnectionError, APIRateLimitError)
-    )
-    def _make_request(
+        
+        async with self._auth_lock:
+            # Another caller may have verified the credentials while this one waited
+            if self._auth_is_cached():
+                return True
+            
+            try:
+                # Make a lightweight call to verify credentials
+                # This is simplified for the example - typically you'd use a proper endpoint
+                response = await self._make_request("GET", "/")
+                self._auth_verified_at = time.monotonic()
+                return True
+            except APIAuthenticationError:
+                raise
+            except Exception as e:
+                logger.error(f"Authentication failed: {str(e)}")
+                raise APIAuthenticationError(f"Failed to authenticate: {str(e)}")
+    
+    def _auth_is_cached(self) -> bool:
+        """
+        Whether a successful authenticate() result is still within its TTL.
+        """
+        return (
+            self._auth_verified_at is not None and
+            time.monotonic() - self._auth_verified_at < AUTH_CACHE_TTL
+        )
+    
+    async def _make_request(
         self,
         method: str,
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+        params: Optional[Dict[str, Any]] = None,
+        use_cache: bool = False,
+        parse: Callable[[bytes], Any] = orjson.loads
+    ) -> Any:
         """
         Make a request to the WhatsApp API with retry logic.
         
+        Connection failures are retried with full-jitter exponential backoff;
+        rate-limited requests are retried after the delay the API asked for.
+        Both wait with asyncio.sleep, so other sends keep running meanwhile.
+        
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint (relative to api_endpoint)
             data: Request body for POST/PUT requests
             params: URL parameters for GET requests
+            use_cache: Serve a bodiless GET from the response cache when fresh,
+                       and cache its successful response; ignored for other methods.
+                       Cached bodies are shared, so callers must not mutate them.
+            parse: Converts the raw body of a successful response into the result
             
         Returns:
-            Parsed JSON response
+            Parsed JSON response, or whatever parse returned
             
         Raises:
             APIConnectionError: If connection fails
             APIAuthenticationError: If authentication fails
-            APIRateLimitError: If rate limit is exceeded
+            APIRateLimitError: If rate limit is exceeded or the circuit is open
             APIResponseError: If API returns an error
+            RuntimeError: If the client has been closed
+        """
+        if self._closed:
+            raise RuntimeError(
+                f"WhatsApp client for phone number ID {self.phone_number_id} is closed"
+            )
+        
+        url = self._endpoints.get(endpoint) or f"{self.api_endpoint}{endpoint}"
+        
+        # Only idempotent reads are cacheable
+        cache_key = None
+        if use_cache and method == "GET" and data is None:
+            cache_key = (url, tuple(sorted((params or {}).items())))
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                if time.monotonic() - cached[0] < RESPONSE_CACHE_TTL:
+                    self._response_cache.move_to_end(cache_key)
+                    return cached[1]
+                del self._response_cache[cache_key]
+        
+        retryable_errors = httpx.TransportError if method == "GET" else _UNSENT_REQUEST_ERRORS
+        
+        attempt = 0
+        while True:
+            # Not retried: the circuit stays open far longer than a backoff
+            if not self._breaker.allow_request():
+                raise APIRateLimitError(
+                    f"Rate limit circuit open for phone number ID {self.phone_number_id}",
+                    retry_after=self._breaker.remaining()
+                )
+            
+            try:
+                body = await self._do_request(method, url, data, params, parse)
+                break
+            except httpx.TransportError as e:
+                if attempt >= self.max_retries or not isinstance(e, retryable_errors):
+                    logger.error(f"WhatsApp API connection error: {str(e)}")
+                    raise APIConnectionError(f"Connection error: {str(e)}")
+                delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) * random.random()
+            except APIRateLimitError as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = getattr(e, "retry_after", None) or RETRY_BASE_DELAY * 2 ** attempt
+            
+            attempt += 1
+            logger.warning(
+                f"Retrying WhatsApp API request in {delay:.2f}s (attempt {attempt} of {self.max_retries})",
+                extra={"url": url, "method": method}
+            )
+            await asyncio.sleep(delay)
+        
+        if cache_key is not None:
+            self._response_cache[cache_key] = (time.monotonic(), body)
+            if len(self._response_cache) > RESPONSE_CACHE_MAX_SIZE:
+                self._response_cache.popitem(last=False)
+        
+        return body
+    
+    async def _do_request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        parse: Callable[[bytes], Any] = orjson.loads
+    ) -> Any:
         """
-        url = f"{self.api_endpoint}{endpoint}"
+        Make a single request to the WhatsApp API.
         
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Absolute request URL
+            data: Request body for POST/PUT requests
+            params: URL parameters for GET requests
+            parse: Converts the raw body of a successful response into the result
+            
+        Returns:
+            Parsed JSON response, or whatever parse returned
+            
+        Raises:
+            httpx.TransportError: If the connection fails, for the caller to retry
+            APIConnectionError: If the request fails unexpectedly
+            APIAuthenticationError: If authentication fails
+            APIRateLimitError: If rate limit is exceeded
+            APIResponseError: If API returns an error
+        """
         try:
-            start_time = time.time()
+            # Timing is only taken when the debug record will be emitted
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                start_time = time.monotonic()
             
             # Make the request
-            response = self.session.request(
+            response = await self.session.request(
                 method=method,
                 url=url,
-                json=data if data else None,
+                content=orjson.dumps(data) if data else None,
                 params=params if params else None,
+                headers=self.headers,
                 timeout=self.timeout
             )
             
             # Log request duration
-            duration = time.time() - start_time
-            logger.debug(
-                f"WhatsApp API request completed in {duration:.2f}s",
-                extra={"url": url, "method": method, "status_code": response.status_code}
-            )
+            if debug_enabled:
+                logger.debug(
+                    "WhatsApp API request completed in %.3fs",
+                    time.monotonic() - start_time,
+                    extra={"url": url, "method": method, "status_code": response.status_code}
+                )
             
             # Handle different response status codes
             if response.status_code == 200 or response.status_code == 201:
-                return response.json()
+                self._breaker.record_success()
+                return parse(response.content)
+            
+            if response.status_code == 429 or response.status_code >= 500:
+                self._breaker.record_failure()
             
             # Parse error response
             error_info = self._parse_error_response(response)
             
             # Handle common error status codes
             if response.status_code == 401 or response.status_code == 403:
+                # Credentials were rejected, so the cached authenticate() result is stale
+                self._auth_verified_at = None
                 raise APIAuthenticationError(
                     f"Authentication failed: {error_info.get('message', 'Unknown error')}"
                 )
             elif response.status_code == 429:
                 # Handle rate limiting
-                retry_after = response.headers.get('Retry-After', 60)
+                retry_after = _parse_retry_after(response.headers.get('Retry-After'))
                 error_message = f"Rate limit exceeded. Retry after {retry_after} seconds."
                 logger.warning(error_message)
-                raise APIRateLimitError(error_message, retry_after=int(retry_after))
+                raise APIRateLimitError(error_message, retry_after=retry_after)
             else:
                 # Handle other API errors
                 error_message = error_info.get('message', f"API error: {response.status_code}")
@@ -163,28 +617,26 @@ class WhatsAppClient:
                 )
                 raise APIResponseError(error_message, status_code=response.status_code)
                 
-        except (Timeout, ConnectionError) as e:
-            logger.error(f"WhatsApp API connection error: {str(e)}")
-            raise APIConnectionError(f"Connection error: {str(e)}")
-        except (APIAuthenticationError, APIRateLimitError, APIResponseError):
+        except (httpx.TransportError, APIAuthenticationError, APIRateLimitError, APIResponseError):
             # Re-raise these specific exceptions
             raise
         except Exception as e:
             logger.error(f"Unexpected error in WhatsApp API request: {str(e)}")
             raise APIConnectionError(f"Request failed: {str(e)}")
     
-    def _parse_error_response(self, response: requests.Response) -> Dict[str, Any]:
+    def _parse_error_response(self, response: httpx.Response) -> Dict[str, Any]:
         """
         Parse error response from the WhatsApp API.
         
         Args:
-            response: Response object from requests
+            response: Response object from httpx
             
         Returns:
             Dictionary containing error details
         """
         try:
-            error_data = response.json()
+            # orjson.JSONDecodeError is a ValueError
+            error_data = orjson.loads(response.content)
             # Facebook Graph API typically returns errors in a specific format
             if 'error' in error_data:
                 return error_data['error']
@@ -192,7 +644,7 @@ class WhatsAppClient:
         except (ValueError, KeyError):
             return {"message": response.text or "Unknown error", "code": response.status_code}
     
-    def send_text(self, recipient_id: str, text: str) -> Dict[str, Any]:
+    async def send_text(self, recipient_id: str, text: str) -> Dict[str, Any]:
         """
         Send a text message via WhatsApp.
         
@@ -204,19 +656,18 @@ class WhatsAppClient:
             API response
         """
         payload = {
-            "messaging_product": "whatsapp",
-            "recipient_type": "individual",
+            **_TEXT_SKELETON,
             "to": recipient_id,
-            "type": "text",
             "text": {
                 "body": text
             }
         }
         
-        logger.debug(f"Sending text message to {recipient_id}", extra={"text_length": len(text)})
-        return self._make_request("POST", "/messages", data=payload)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Sending text message to {recipient_id}", extra={"text_length": len(text)})
+        return await self._make_request("POST", "/messages", data=payload)
     
-    def send_template(
+    async def send_template(
         self,
         recipient_id: str,
         template_name: str,
@@ -233,6 +684,30 @@ class WhatsAppClient:
         Returns:
             API response
         """
+        payload = {
+            **_TEMPLATE_SKELETON,
+            "to": recipient_id,
+            "template": self._build_template(template_name, template_data)
+        }
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Sending template message to {recipient_id}",
+                extra={"template_name": template_name}
+            )
+        return await self._make_request("POST", "/messages", data=payload)
+    
+    def _build_template(self, template_name: str, template_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the template object of a template message payload.
+        
+        Args:
+            template_name: Name of the template
+            template_data: Template parameters
+            
+        Returns:
+            Template object for the message payload
+        """
         # Prepare components based on template_data
         components = []
         
@@ -277,26 +752,99 @@ class WhatsAppClient:
                         "parameters": button_params
                     })
         
-        # Prepare the payload
-        payload = {
-            "messaging_product": "whatsapp",
-            "recipient_type": "individual",
-            "to": recipient_id,
-            "type": "template",
-            "template": {
-                "name": template_name,
-                "language": {
-                    "code": template_data.get("language", "en_US")
-                },
-                "components": components
-            }
+        return {
+            "name": template_name,
+            "language": {
+                "code": template_data.get("language", "en_US")
+            },
+            "components": components
         }
+    
+    async def send_text_batch(
+        self,
+        messages: List[Tuple[str, str]]
+    ) -> List[Union[Optional[str], Exception]]:
+        """
+        Send text messages to many recipients concurrently.
+        
+        At most BATCH_SEND_CONCURRENCY requests are in flight per client;
+        rate-limited sends back off through _make_request's retry handling
+        without holding up the others.
+        
+        Args:
+            messages: (recipient_id, text) pairs
+            
+        Returns:
+            Message ID or raised exception for each message, in input order
+        """
+        payloads = [
+            {
+                **_TEXT_SKELETON,
+                "to": recipient_id,
+                "text": {
+                    "body": text
+                }
+            }
+            for recipient_id, text in messages
+        ]
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Sending {len(payloads)} text messages")
+        return await asyncio.gather(
+            *(self._send_payload(payload) for payload in payloads),
+            return_exceptions=True
+        )
+    
+    async def send_template_batch(
+        self,
+        recipient_ids: List[str],
+        template_name: str,
+        template_data: Dict[str, Any]
+    ) -> List[Union[Optional[str], Exception]]:
+        """
+        Send the same template message to many recipients concurrently.
+        
+        The template object is built once and shared by every payload.
         
-        logger.debug(
-            f"Sending template message to {recipient_id}",
-            extra={"template_name": template_name}
+        Args:
+            recipient_ids: Recipients' WhatsApp IDs
+            template_name: Name of the template
+            template_data: Template parameters
+            
+        Returns:
+            Message ID or raised exception for each recipient, in input order
+        """
+        template = self._build_template(template_name, template_data)
+        payloads = [
+            {
+                **_TEMPLATE_SKELETON,
+                "to": recipient_id,
+                "template": template
+            }
+            for recipient_id in recipient_ids
+        ]
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Sending template message to {len(payloads)} recipients",
+                extra={"template_name": template_name}
+            )
+        return await asyncio.gather(
+            *(self._send_payload(payload) for payload in payloads),
+            return_exceptions=True
         )
-        return self._make_request("POST", "/messages", data=payload)
+    
+    async def _send_payload(self, payload: Dict[str, Any]) -> Optional[str]:
+        """
+        Send one message payload, waiting for a free batch send slot.
+        
+        Returns:
+            ID of the sent message
+        """
+        async with self._send_semaphore:
+            return await self._make_request(
+                "POST", "/messages", data=payload, parse=_extract_message_id
+            )
     
     def _format_template_parameter(self, param_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -308,53 +856,10 @@ class WhatsAppClient:
         Returns:
             Formatted parameter
         """
-        param_type = param_data.get("type", "text")
-        
-        if param_type == "text":
-            return {
-                "type": "text",
-                "text": param_data.get("text", "")
-            }
-        elif param_type == "image":
-            return {
-                "type": "image",
-                "image": {
-                    "link": param_data.get("link", "")
-                }
-            }
-        elif param_type == "document":
-            return {
-                "type": "document",
-                "document": {
-                    "link": param_data.get("link", ""),
-                    "filename": param_data.get("filename", "")
-                }
-            }
-        elif param_type == "video":
-            return {
-                "type": "video",
-                "video": {
-                    "link": param_data.get("link", "")
-                }
-            }
-        elif param_type == "location":
-            return {
-                "type": "location",
-                "location": {
-                    "latitude": param_data.get("latitude", 0),
-                    "longitude": param_data.get("longitude", 0),
-                    "name": param_data.get("name", ""),
-                    "address": param_data.get("address", "")
-                }
-            }
-        else:
-            # Default to text
-            return {
-                "type": "text",
-                "text": str(param_data.get("value", ""))
-            }
+        builder = _PARAM_BUILDERS.get(param_data.get("type", "text"), _build_default_param)
+        return builder(param_data)
     
-    def send_media(
+    async def send_media(
         self,
         recipient_id: str,
         media_type: str,
@@ -374,9 +879,8 @@ class WhatsAppClient:
             API response
         """
         # Validate media type
-        valid_media_types = ["image", "video", "audio", "document"]
-        if media_type not in valid_media_types:
-            raise ValueError(f"Invalid media type: {media_type}. Must be one of {valid_media_types}")
+        if media_type not in _VALID_MEDIA:
+            raise ValueError(f"Invalid media type: {media_type}. Must be one of {sorted(_VALID_MEDIA)}")
         
         # Build the media object
         media_object = {
@@ -384,25 +888,25 @@ class WhatsAppClient:
         }
         
         # Add caption for supported media types
-        if caption and media_type in ["image", "video", "document"]:
+        if caption and media_type in _MEDIA_WITH_CAPTION:
             media_object["caption"] = caption
         
         # Build the payload
         payload = {
-            "messaging_product": "whatsapp",
-            "recipient_type": "individual",
+            **_MESSAGE_SKELETON,
             "to": recipient_id,
             "type": media_type,
             media_type: media_object
         }
         
-        logger.debug(
-            f"Sending {media_type} message to {recipient_id}",
-            extra={"media_url": media_url}
-        )
-        return self._make_request("POST", "/messages", data=payload)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Sending {media_type} message to {recipient_id}",
+                extra={"media_url": media_url}
+            )
+        return await self._make_request("POST", "/messages", data=payload)
     
-    def send_interactive(
+    async def send_interactive(
         self,
         recipient_id: str,
         interactive_data: Dict[str, Any]
@@ -419,30 +923,42 @@ class WhatsAppClient:
         """
         # Validate interactive type
         interactive_type = interactive_data.get("type")
-        valid_types = ["button", "list", "product", "product_list"]
-        
-        if not interactive_type or interactive_type not in valid_types:
-            raise ValueError(f"Invalid interactive type: {interactive_type}. Must be one of {valid_types}")
+        if interactive_type not in _VALID_INTERACTIVE:
+            raise ValueError(
+                f"Invalid interactive type: {interactive_type}. Must be one of {sorted(_VALID_INTERACTIVE)}"
+            )
         
         # Prepare payload
         payload = {
-            "messaging_product": "whatsapp",
-            "recipient_type": "individual",
+            **_INTERACTIVE_SKELETON,
             "to": recipient_id,
-            "type": "interactive",
             "interactive": interactive_data
         }
         
-        logger.debug(
-            f"Sending interactive message to {recipient_id}",
-            extra={"interactive_type": interactive_type}
-        )
-        return self._make_request("POST", "/messages", data=payload)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Sending interactive message to {recipient_id}",
+                extra={"interactive_type": interactive_type}
+            )
+        return await self._make_request("POST", "/messages", data=payload)
     
-    def __del__(self):
-        """Clean up resources when object is destroyed."""
-        if hasattr(self, 'session') and self.session:
-            try:
-                self.session.close()
-            except Exception:
-                pass
\ No newline at end of file
+    async def aclose(self) -> None:
+        """
+        Release the client.
+        
+        The pooled connections belong to the shared session, which stays open
+        for other tenants and is closed by close_shared_session on shutdown.
+        Requests made through the client after this raise RuntimeError.
+        """
+        self._closed = True
+        logger.debug(f"WhatsApp client closed for phone number ID: {self.phone_number_id}")
+    
+    async def close(self) -> None:
+        """Release the client; alias of aclose."""
+        await self.aclose()
+    
+    async def __aenter__(self) -> "WhatsAppClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
\ No newline at end of file
@@ -0,0 +1,152 @@
+"""
+WhatsApp webhook payload schema.
+
+The schema is compiled once at import time into a tree of check functions,
+so validating a webhook only runs the checks the schema actually declares
+instead of re-interpreting the schema on every request.
+"""
+
+from typing import Any, Callable, Dict, List
+
+from app.utils.exceptions import ValidationError
+
+# Structural schema for WhatsApp Cloud API webhook notifications. Only the
+# fields the channel reads are constrained; anything else is passed through.
+WHATSAPP_WEBHOOK_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["object", "entry"],
+    "properties": {
+        "object": {"type": "string"},
+        "entry": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["changes"],
+                "properties": {
+                    "id": {"type": "string"},
+                    "changes": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "required": ["value"],
+                            "properties": {
+                                "field": {"type": "string"},
+                                "value": {
+                                    "type": "object",
+                                    "properties": {
+                                        "messaging_product": {"type": "string"},
+                                        "messages": {
+                                            "type": "array",
+                                            "items": {
+                                                "type": "object",
+                                                "required": ["from", "id", "timestamp"],
+                                                "properties": {
+                                                    "from": {"type": "string"},
+                                                    "id": {"type": "string"},
+                                                    "timestamp": {"type": "string"},
+                                                    "type": {"type": "string"}
+                                                }
+                                            }
+                                        },
+                                        "statuses": {"type": "array"}
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
+_JSON_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "number": (int, float),
+    "integer": int,
+    "boolean": bool,
+}
+
+Validator = Callable[[Any, str], None]
+
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[Any], None]:
+    """
+    Compile a JSON Schema subset into a validator function.
+
+    Supports the "type", "required", "properties" and "items" keywords.
+
+    Args:
+        schema: JSON Schema to compile
+
+    Returns:
+        Function that raises ValidationError if its argument does not match
+    """
+    check = _compile_node(schema)
+
+    def validate(payload: Any) -> None:
+        check(payload, "$")
+
+    return validate
+
+
+def _compile_node(schema: Dict[str, Any]) -> Validator:
+    checks: List[Validator] = []
+
+    schema_type = schema.get("type")
+    if schema_type is not None:
+        expected = _JSON_TYPES[schema_type]
+
+        def check_type(value: Any, path: str) -> None:
+            # bool is a subclass of int but not a JSON number
+            if not isinstance(value, expected) or (
+                isinstance(value, bool) and schema_type != "boolean"
+            ):
+                raise ValidationError(f"{path} must be of type {schema_type}")
+
+        checks.append(check_type)
+
+    required = tuple(schema.get("required", ()))
+    if required:
+        def check_required(value: Any, path: str) -> None:
+            for name in required:
+                if name not in value:
+                    raise ValidationError(f"{path}.{name} is required")
+
+        checks.append(check_required)
+
+    properties = {
+        name: _compile_node(subschema)
+        for name, subschema in schema.get("properties", {}).items()
+    }
+    if properties:
+        def check_properties(value: Any, path: str) -> None:
+            for name, check in properties.items():
+                if name in value:
+                    check(value[name], f"{path}.{name}")
+
+        checks.append(check_properties)
+
+    if "items" in schema:
+        check_item = _compile_node(schema["items"])
+
+        def check_items(value: Any, path: str) -> None:
+            for index, item in enumerate(value):
+                check_item(item, f"{path}[{index}]")
+
+        checks.append(check_items)
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value: Any, path: str) -> None:
+        for check in checks:
+            check(value, path)
+
+    return check_all
+
+
+# Compiled once and shared by all WhatsAppChannel instances
+validate_webhook_payload = compile_schema(WHATSAPP_WEBHOOK_SCHEMA)
@@ -1,17 +1,44 @@
 from functools import lru_cache
-from pydantic_settings import BaseSettings
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Dict, List, Optional, Union
 import os
 from pathlib import Path
 
+def _find_env_file() -> str:
+    """
+    Find the .env file to load based on the environment.
+    
+    Priority:
+    1. .env.{ENV}.local
+    2. .env.{ENV}
+    3. .env.local
+    4. .env
+    """
+    env = os.getenv("ENV", "development")
+    env_files = (
+        f".env.{env}.local",
+        f".env.{env}",
+        ".env.local",
+        ".env"
+    )
+    
+    for env_file in env_files:
+        if Path(env_file).is_file():
+            return env_file
+    
+    return ".env"
+
+# Resolved once at import rather than on every settings load
+_ENV_FILE = _find_env_file()
+
 class LoggingSettings(BaseSettings):
     """Logging-specific configuration settings."""
     LEVEL: str = "INFO"
     FORMAT: str = "json"
     CORRELATION_ID_HEADER: str = "X-Correlation-ID"
     
-    class Config:
-        env_prefix = "LOGGING_"
+    model_config = SettingsConfigDict(env_prefix="LOGGING_", env_file=_ENV_FILE, extra="ignore", frozen=True)
 
 class DatabaseSettings(BaseSettings):
     """Database-specific configuration settings."""
@@ -19,8 +46,7 @@ class DatabaseSettings(BaseSettings):
     MAX_CONNECTIONS: int = 10
     TIMEOUT: int = 30
     
-    class Config:
-        env_prefix = "DB_"
+    model_config = SettingsConfigDict(env_prefix="DB_", env_file=_ENV_FILE, extra="ignore", frozen=True)
 
 class ChannelSettings(BaseSettings):
     """Channel-specific configuration settings."""
@@ -28,9 +54,10 @@ class ChannelSettings(BaseSettings):
     FACEBOOK_ENABLED: bool = True
     TELEGRAM_ENABLED: bool = True
     WEBCHAT_ENABLED: bool = True
+    # Keep the serialized webhook body on normalized messages (debugging only)
+    STORE_RAW_PAYLOAD: bool = False
     
-    class Config:
-        env_prefix = "CHANNEL_"
+    model_config = SettingsConfigDict(env_prefix="CHANNEL_", env_file=_ENV_FILE, extra="ignore", frozen=True)
 
 class WebSocketSettings(BaseSettings):
     """WebSocket-specific configuration settings."""
@@ -38,8 +65,7 @@ class WebSocketSettings(BaseSettings):
     HEARTBEAT_INTERVAL: int = 30
     CONNECTION_TIMEOUT: int = 60
     
-    class Config:
-        env_prefix = "WS_"
+    model_config = SettingsConfigDict(env_prefix="WS_", env_file=_ENV_FILE, extra="ignore", frozen=True)
 
 class SecuritySettings(BaseSettings):
     """Security-specific configuration settings."""
@@ -48,8 +74,7 @@ class SecuritySettings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     WEBHOOK_SECRET_HEADER: str = "X-Webhook-Secret"
     
-    class Config:
-        env_prefix = "SECURITY_"
+    model_config = SettingsConfigDict(env_prefix="SECURITY_", env_file=_ENV_FILE, extra="ignore", frozen=True)
 
 class Settings(BaseSettings):
     """Main application settings."""
@@ -63,42 +88,29 @@ class Settings(BaseSettings):
     # Services URLs
     CHAT_SERVICE_URL: str
     
-    # Nested settings
-    logging: LoggingSettings = LoggingSettings()
-    database: DatabaseSettings = DatabaseSettings()
-    channel: ChannelSettings = ChannelSettings()
-    websocket: WebSocketSettings = WebSocketSettings()
-    security: SecuritySettings = SecuritySettings()
+    # Nested settings, built when Settings is instantiated rather than at import
+    logging: LoggingSettings = Field(default_factory=LoggingSettings)
+    database: DatabaseSettings = Field(default_factory=DatabaseSettings)
+    channel: ChannelSettings = Field(default_factory=ChannelSettings)
+    websocket: WebSocketSettings = Field(default_factory=WebSocketSettings)
+    security: SecuritySettings = Field(default_factory=SecuritySettings)
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
+    model_config = SettingsConfigDict(
+        env_file=_ENV_FILE,
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="ignore",
+        frozen=True
+    )
 
-def load_env_file() -> None:
+def load_env_file() -> str:
     """
-    Load environment variables from .env file based on the environment.
+    Return the .env file Settings loads.
     
-    Priority:
-    1. .env.{ENV}.local
-    2. .env.{ENV}
-    3. .env.local
-    4. .env
+    The file is resolved once at import (see _find_env_file) and passed to
+    Settings through its env_file config, so nothing is loaded here.
     """
-    env = os.getenv("ENV", "development")
-    env_files = [
-        f".env.{env}.local",
-        f".env.{env}",
-        ".env.local",
-        ".env"
-    ]
-    
-    for env_file in env_files:
-        env_path = Path(env_file)
-        if env_path.exists():
-            # Use Pydantic's load method instead of a direct load
-            # to ensure proper parsing and validation
-            return
+    return _ENV_FILE
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -107,5 +119,4 @@ def get_settings() -> Settings:
     
     Using lru_cache to avoid re-reading environment variables on each call.
     """
-    load_env_file()
     return Settings()
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""
+Arena allocator for binary message content.
+
+This module defines BytesArena, which packs the binary content of a batch of
+messages into a few large buffers instead of one bytes object per message.
+"""
+
+from typing import List, Optional
+
+# Size of each arena buffer; larger payloads get a buffer of their own
+MIN_CHUNK = 64 * 1024
+
+
+class BytesArena:
+    """
+    Bump allocator handing out read-only views into shared buffers.
+
+    Intended for workers that build a batch of messages, process it and then
+    drop it as a whole: content copied in with alloc() sits contiguously in
+    memory, and everything is freed together once the arena and the messages
+    holding its views are released. Individual allocations cannot be freed.
+    """
+    __slots__ = ("chunk_size", "_chunks", "_current", "_offset")
+
+    def __init__(self, chunk_size: int = MIN_CHUNK):
+        """
+        Initialize an empty arena.
+
+        Args:
+            chunk_size: Size of each buffer allocated by the arena
+        """
+        self.chunk_size = chunk_size
+        self._chunks: List[bytearray] = []
+        self._current: Optional[memoryview] = None
+        self._offset = 0
+
+    def alloc(self, data: bytes) -> memoryview:
+        """
+        Copy data into the arena.
+
+        Args:
+            data: Bytes to store
+
+        Returns:
+            Read-only view of the stored copy
+        """
+        size = len(data)
+
+        if size > self.chunk_size:
+            # Would waste most of a shared buffer, so it gets its own
+            chunk = bytearray(data)
+            self._chunks.append(chunk)
+            return memoryview(chunk).toreadonly()
+
+        if self._current is None or self._offset + size > self.chunk_size:
+            chunk = bytearray(self.chunk_size)
+            self._chunks.append(chunk)
+            self._current = memoryview(chunk)
+            self._offset = 0
+
+        start = self._offset
+        end = start + size
+        view = self._current[start:end]
+        view[:] = data
+        self._offset = end
+        return view.toreadonly()
+
+    def release(self) -> None:
+        """
+        Drop the arena's references to its buffers.
+
+        Buffers stay alive while views handed out by alloc() are still
+        referenced, so call this once the batch has been flushed.
+        """
+        self._chunks.clear()
+        self._current = None
+        self._offset = 0
+
+    def __len__(self) -> int:
+        """Total size of the arena's buffers in bytes."""
+        return sum(len(chunk) for chunk in self._chunks)
@@ -5,10 +5,18 @@ This module defines the Channel class that represents a messaging platform
 (WhatsApp, Facebook Messenger, etc.) and its configuration.
 """
 
-from typing import Any, Dict, List, Optional, Set
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+import orjson
 from pydantic import validator
 
 
+# Shared read-only value of config, features and metadata when none are given
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
 class Channel:
     """
     Represents a messaging channel in the system.
@@ -16,6 +24,21 @@ class Channel:
     A Channel encapsulates a messaging platform like WhatsApp, Facebook Messenger,
     Telegram, or Web Chat, along with its configuration for a specific tenant.
     """
+    __slots__ = (
+        "channel_id",
+        "name",
+        "provider",
+        "config",
+        "tenant_id",
+        "enabled",
+        "_supported_message_types",
+        "_supported_content_types",
+        "_message_types_order",
+        "_content_types_order",
+        "_features",
+        "metadata",
+        "_capabilities",
+    )
     
     def __init__(
         self,
@@ -45,16 +68,114 @@ class Channel:
             features: Dictionary of feature flags for this channel
             metadata: Additional metadata for this channel
         """
-        self.channel_id = channel_id
+        # IDs repeat across every channel of a tenant and provider, so they
+        # are interned; sys.intern only accepts exact str
+        self.channel_id = sys.intern(channel_id) if type(channel_id) is str else channel_id
         self.name = name
-        self.provider = provider
-        self.config = config or {}
-        self.tenant_id = tenant_id
+        self.provider = sys.intern(provider) if type(provider) is str else provider
+        self.config = config or _EMPTY
+        self.tenant_id = sys.intern(tenant_id) if type(tenant_id) is str else tenant_id
+        self._capabilities: Optional[Mapping[str, Any]] = None
         self.enabled = enabled
         self.supported_message_types = supported_message_types or []
         self.supported_content_types = supported_content_types or {}
-        self.features = features or {}
-        self.metadata = metadata or {}
+        self.features = features or _EMPTY
+        self.metadata = metadata or _EMPTY
+    
+    @property
+    def supported_message_types(self) -> Tuple[str, ...]:
+        """
+        Message types supported by this channel, in the order they were given.
+        
+        Read-only; assign a new list to change them.
+        """
+        return self._message_types_order
+    
+    @supported_message_types.setter
+    def supported_message_types(self, message_types: List[str]) -> None:
+        # The order is kept for callers, the frozenset makes capability
+        # checks constant time
+        self._message_types_order = tuple(message_types)
+        self._supported_message_types = frozenset(self._message_types_order)
+        self._capabilities = None
+    
+    @property
+    def supported_content_types(self) -> Mapping[str, Tuple[str, ...]]:
+        """
+        Content types supported by this channel per message type, in the
+        order they were given.
+        
+        Read-only; assign a new dict to change them.
+        """
+        return self._content_types_order
+    
+    @supported_content_types.setter
+    def supported_content_types(self, content_types: Dict[str, List[str]]) -> None:
+        self._content_types_order = MappingProxyType({
+            message_type: tuple(types)
+            for message_type, types in content_types.items()
+        })
+        self._supported_content_types = {
+            message_type: frozenset(types)
+            for message_type, types in self._content_types_order.items()
+        }
+        self._capabilities = None
+    
+    @property
+    def features(self) -> Mapping[str, bool]:
+        """Feature flags of this channel."""
+        return self._features
+    
+    @features.setter
+    def features(self, features: Mapping[str, bool]) -> None:
+        # Copied so later changes to the caller's dict cannot make the
+        # cached capabilities stale
+        self._features = features if features is _EMPTY else MappingProxyType(dict(features))
+        self._capabilities = None
+    
+    def mutable_config(self) -> Dict[str, Any]:
+        """
+        Get the channel configuration for modification.
+        
+        Channels without configuration share one read-only empty mapping;
+        this swaps it for a dict of the channel's own before returning it.
+        
+        Returns:
+            The channel's config dict
+        """
+        if self.config is _EMPTY:
+            self.config = {}
+        return self.config
+    
+    def mutable_features(self) -> Dict[str, bool]:
+        """
+        Get the channel feature flags for modification.
+        
+        Features are held read-only once assigned; this swaps them for a
+        dict of the channel's own before returning it. Changes made through
+        the returned dict show up in get_capabilities().
+        
+        Returns:
+            The channel's features dict
+        """
+        if type(self._features) is not dict:
+            self._features = dict(self._features)
+            self._capabilities = None
+        return self._features
+    
+    def mutable_metadata(self) -> Dict[str, Any]:
+        """
+        Get the channel metadata for modification.
+        
+        Channels without metadata share one read-only empty mapping; this
+        swaps it for a dict of the channel's own before returning it.
+        
+        Returns:
+            The channel's metadata dict
+        """
+        if self.metadata is _EMPTY:
+            self.metadata = {}
+        return self.metadata
     
     def is_enabled(self, tenant_id: Optional[str] = None) -> bool:
         """
@@ -72,18 +193,23 @@ class Channel:
         
         return self.enabled
     
-    def get_capabilities(self) -> Dict[str, Any]:
+    def get_capabilities(self) -> Mapping[str, Any]:
         """
         Get the capabilities of this channel.
         
+        Built on first use and reused until the capabilities are reassigned;
+        the result and its values are read-only, so it can be shared.
+        
         Returns:
-            Dictionary containing the channel's capabilities
+            Read-only mapping containing the channel's capabilities
         """
-        return {
-            "supported_message_types": self.supported_message_types,
-            "supported_content_types": self.supported_content_types,
-            "features": self.features,
-        }
+        if self._capabilities is None:
+            self._capabilities = MappingProxyType({
+                "supported_message_types": self._message_types_order,
+                "supported_content_types": self._content_types_order,
+                "features": MappingProxyType(self._features),
+            })
+        return self._capabilities
     
     def supports_message_type(self, message_type: str) -> bool:
         """
@@ -95,7 +221,7 @@ class Channel:
         Returns:
             True if the message type is supported, False otherwise
         """
-        return message_type in self.supported_message_types
+        return message_type in self._supported_message_types
     
     def supports_content_type(self, message_type: str, content_type: str) -> bool:
         """
@@ -108,11 +234,11 @@ class Channel:
         Returns:
             True if the content type is supported for the message type, False otherwise
         """
-        if not self.supports_message_type(message_type):
+        if message_type not in self._supported_message_types:
             return False
         
-        supported_types = self.supported_content_types.get(message_type, [])
-        return content_type in supported_types
+        supported_types = self._supported_content_types.get(message_type)
+        return supported_types is not None and content_type in supported_types
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -125,15 +251,27 @@ class Channel:
             "channel_id": self.channel_id,
             "name": self.name,
             "provider": self.provider,
-            "config": self.config,
+            "config": dict(self.config),
             "tenant_id": self.tenant_id,
             "enabled": self.enabled,
-            "supported_message_types": self.supported_message_types,
-            "supported_content_types": self.supported_content_types,
-            "features": self.features,
-            "metadata": self.metadata,
+            "supported_message_types": list(self._message_types_order),
+            "supported_content_types": {
+                message_type: list(content_types)
+                for message_type, content_types in self._content_types_order.items()
+            },
+            "features": dict(self.features),
+            "metadata": dict(self.metadata),
         }
     
+    def to_json(self) -> bytes:
+        """
+        Serialize the channel to JSON.
+        
+        Returns:
+            UTF-8 encoded JSON representation of the channel
+        """
+        return orjson.dumps(self.to_dict())
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Channel":
         """
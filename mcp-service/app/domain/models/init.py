@@ -7,8 +7,10 @@ in the MCP service domain, such as messages and channels.
 
 from app.domain.models.message import Message
 from app.domain.models.channel import Channel
+from app.domain.models.arena import BytesArena
 
 __all__ = [
     "Message",
     "Channel",
+    "BytesArena",
 ]
\ No newline at end of file
@@ -5,13 +5,97 @@ This module defines the core Message class that serves as the standardized inter
 representation of messages, regardless of their source channel.
 """
 
+import sys
+from base64 import b64encode
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
-from uuid import uuid4
+from functools import lru_cache
+from os import urandom
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Union
 
+import orjson
 from pydantic import validator
 
 
+# Defaults applied by Message.construct for fields that default to an empty
+# string in __init__; every other field defaults to None
+_FIELD_DEFAULTS: Dict[str, Any] = {
+    "tenant_id": "",
+    "channel_id": "",
+    "sender_id": "",
+    "recipient_id": "",
+    "message_type": "",
+    "content_type": "",
+    "content": "",
+}
+
+# Shared read-only metadata of messages created without any; replaced by a
+# real dict on the first write through mutable_metadata()
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+_utcnow = datetime.utcnow
+
+
+def _new_id() -> str:
+    # 128 random bits as hex: same entropy as uuid4 without building a UUID object
+    return urandom(16).hex()
+
+
+# Low-cardinality string fields shared by many messages; interning them
+# keeps one copy of each value and makes comparisons pointer checks
+_INTERNED_FIELDS = ("tenant_id", "channel_id", "message_type", "content_type")
+
+
+def _intern(value: Any) -> Any:
+    # sys.intern only accepts exact str, not subclasses such as str enums
+    return sys.intern(value) if type(value) is str else value
+
+
+def _json_default(value: Any) -> str:
+    # orjson cannot serialize binary content (bytes or BytesArena views),
+    # so it is written as base64 text
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return b64encode(value).decode("ascii")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+@lru_cache(maxsize=1024)
+def _parse_ts(value: str) -> datetime:
+    # Webhook retries replay the same timestamps, so recent parses are reused;
+    # datetimes are immutable, so sharing them between messages is safe
+    return datetime.fromisoformat(value)
+
+
+# Fields Message.validate requires to be non-empty, in error-report order
+_REQUIRED_FIELDS = ("tenant_id", "channel_id", "message_type", "content_type")
+
+
+def _validate_text(message: "Message") -> List[str]:
+    errors = []
+    if message.content_type != "text/plain":
+        errors.append(f"Invalid content_type '{message.content_type}' for text message")
+    
+    if not isinstance(message.content, str):
+        errors.append("Content for text message must be a string")
+    
+    return errors
+
+
+def _validate_image(message: "Message") -> List[str]:
+    if not message.content_type.startswith("image/"):
+        return [f"Invalid content_type '{message.content_type}' for image message"]
+    return []
+
+
+# Message type -> content checks for that type; validations for other message
+# types are added here. str enum members hash like their values, so a
+# MessageType looks up the same entry as its string
+_TYPE_VALIDATORS = {
+    "text": _validate_text,
+    "image": _validate_image,
+}
+
+
 class Message:
     """
     Represents a normalized message in the system.
@@ -20,6 +104,21 @@ class Message:
     It contains the content of the message, metadata about the message,
     and information about the sender and recipient.
     """
+    __slots__ = (
+        "message_id",
+        "tenant_id",
+        "channel_id",
+        "conversation_id",
+        "sender_id",
+        "recipient_id",
+        "message_type",
+        "content_type",
+        "content",
+        "metadata",
+        "timestamp",
+        "channel_message_id",
+        "raw_payload",
+    )
     
     def __init__(
         self,
@@ -31,10 +130,11 @@ class Message:
         recipient_id: str = "",
         message_type: str = "",
         content_type: str = "",
-        content: Union[Dict[str, Any], str, bytes] = "",
+        content: Union[Dict[str, Any], str, bytes, memoryview] = "",
         metadata: Optional[Dict[str, Any]] = None,
         timestamp: Optional[datetime] = None,
         channel_message_id: Optional[str] = None,
+        raw_payload: Optional[bytes] = None,
     ):
         """
         Initialize a new Message instance.
@@ -48,30 +148,46 @@ class Message:
             recipient_id: Identifier of the message recipient
             message_type: Type of message (text, image, audio, etc.)
             content_type: MIME type of the message content
-            content: Actual message content (text, binary data, or structured content)
+            content: Actual message content (text, binary data, or structured content);
+                binary content may be a memoryview into a BytesArena
             metadata: Additional metadata associated with the message
             timestamp: When the message was created (defaults to current time)
             channel_message_id: Original message ID from the source channel
+            raw_payload: Serialized original channel payload, if retained
         """
-        self.message_id = message_id or str(uuid4())
-        self.tenant_id = tenant_id
-        self.channel_id = channel_id
+        self.message_id = message_id or _new_id()
+        self.tenant_id = _intern(tenant_id)
+        self.channel_id = _intern(channel_id)
         self.conversation_id = conversation_id
         self.sender_id = sender_id
         self.recipient_id = recipient_id
-        self.message_type = message_type
-        self.content_type = content_type
+        self.message_type = _intern(message_type)
+        self.content_type = _intern(content_type)
         self.content = content
-        self.metadata = metadata or {}
-        self.timestamp = timestamp or datetime.utcnow()
+        self.metadata = metadata or _EMPTY
+        self.timestamp = timestamp or _utcnow()
         self.channel_message_id = channel_message_id
+        self.raw_payload = raw_payload
     
-    def to_dict(self) -> Dict[str, Any]:
+    def mutable_metadata(self) -> Dict[str, Any]:
         """
-        Convert the message to a dictionary representation.
+        Get the message metadata for modification.
+        
+        Messages without metadata share one read-only empty mapping; this
+        swaps it for a dict of the message's own before returning it.
         
         Returns:
-            Dictionary representation of the message
+            The message's metadata dict
+        """
+        if self.metadata is _EMPTY:
+            self.metadata = {}
+        return self.metadata
+    
+    def _fields(self) -> Dict[str, Any]:
+        """
+        Collect the serialized fields shared by to_dict and to_json.
+        
+        The timestamp is left as a datetime for the caller to render.
         """
         return {
             "message_id": self.message_id,
@@ -83,11 +199,89 @@ class Message:
             "message_type": self.message_type,
             "content_type": self.content_type,
             "content": self.content,
-            "metadata": self.metadata,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
+            "metadata": dict(self.metadata),
+            "timestamp": self.timestamp,
             "channel_message_id": self.channel_message_id,
         }
     
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the message to a dictionary representation.
+        
+        Returns:
+            Dictionary representation of the message
+        """
+        fields = self._fields()
+        if self.timestamp:
+            fields["timestamp"] = self.timestamp.isoformat()
+        return fields
+    
+    def to_json(self) -> bytes:
+        """
+        Serialize the message to JSON.
+        
+        Produces the same document as serializing to_dict(), without building
+        the timestamp string first; orjson writes the datetime directly.
+        Binary content is written as a base64 string.
+        
+        Returns:
+            UTF-8 encoded JSON representation of the message
+        """
+        return orjson.dumps(self._fields(), default=_json_default)
+    
+    @classmethod
+    def construct(cls, **fields: Any) -> "Message":
+        """
+        Create a message from trusted field values without running __init__.
+        
+        Intended for internal code that has already built every field, such
+        as channel normalizers. Unlike __init__, no message_id or timestamp
+        is generated; fields that are not given get the __init__ defaults.
+        
+        Args:
+            **fields: Message field values
+            
+        Returns:
+            A new Message instance
+        """
+        return cls._from_fields(fields)
+    
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> "Message":
+        """
+        Create a message from a trusted dictionary without running __init__.
+        
+        The counterpart of from_dict for rows read back from storage, which
+        already carry every generated field: no kwargs are unpacked and no
+        message_id or timestamp is generated. An ISO 8601 timestamp string
+        is parsed as in from_dict; data is not modified.
+        
+        Args:
+            data: Dictionary representation of a message
+            
+        Returns:
+            A new Message instance
+        """
+        message = cls._from_fields(data)
+        if isinstance(message.timestamp, str):
+            message.timestamp = _parse_ts(message.timestamp)
+        return message
+    
+    @classmethod
+    def _from_fields(cls, fields: Dict[str, Any]) -> "Message":
+        message = object.__new__(cls)
+        get = fields.get
+        for name in cls.__slots__:
+            setattr(message, name, get(name, _FIELD_DEFAULTS.get(name)))
+        
+        if message.metadata is None:
+            message.metadata = _EMPTY
+        
+        for name in _INTERNED_FIELDS:
+            setattr(message, name, _intern(getattr(message, name)))
+        
+        return message
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Message":
         """
@@ -101,7 +295,7 @@ class Message:
         """
         # Handle timestamp conversion if it's a string
         if isinstance(data.get("timestamp"), str):
-            data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+            data["timestamp"] = _parse_ts(data["timestamp"])
         
         return cls(**data)
     
@@ -115,34 +309,12 @@ class Message:
         Raises:
             ValidationException: If the message is invalid with detailed validation errors
         """
-        errors = []
-        
-        # Check required fields
-        if not self.tenant_id:
-            errors.append("tenant_id is required")
-        
-        if not self.channel_id:
-            errors.append("channel_id is required")
-        
-        if not self.message_type:
-            errors.append("message_type is required")
-        
-        if not self.content_type:
-            errors.append("content_type is required")
+        errors = [f"{name} is required" for name in _REQUIRED_FIELDS if not getattr(self, name)]
         
         # Validate content based on message_type and content_type
-        if self.message_type == "text":
-            if self.content_type != "text/plain":
-                errors.append(f"Invalid content_type '{self.content_type}' for text message")
-            
-            if not isinstance(self.content, str):
-                errors.append("Content for text message must be a string")
-        
-        elif self.message_type == "image":
-            if not self.content_type.startswith("image/"):
-                errors.append(f"Invalid content_type '{self.content_type}' for image message")
-        
-        # Additional validations can be added for other message types
+        type_validator = _TYPE_VALIDATORS.get(self.message_type)
+        if type_validator is not None:
+            errors += type_validator(self)
         
         if errors:
             from app.utils.exceptions import ValidationException
@@ -156,4 +328,44 @@ class Message:
                 f"tenant_id={self.tenant_id}, "
                 f"channel_id={self.channel_id}, "
                 f"message_type={self.message_type}, "
-                f"timestamp={self.timestamp})")
\ No newline at end of file
+                f"timestamp={self.timestamp})")
+
+
+class WebhookBatch:
+    """
+    A batch of inbound channel messages stored column-wise.
+    
+    Each field is kept in its own list, with one position per message, so
+    consumers that only need a few fields (deduplication on channel message
+    IDs, bulk inserts) can walk those columns without touching the rest.
+    """
+    __slots__ = (
+        "tenant_id",
+        "channel_id",
+        "message_ids",
+        "channel_message_ids",
+        "sender_ids",
+        "timestamps",
+        "message_types",
+        "contents",
+    )
+    
+    def __init__(self, tenant_id: str = "", channel_id: str = ""):
+        """
+        Initialize an empty batch for a channel.
+        
+        Args:
+            tenant_id: Identifier of the tenant the messages belong to
+            channel_id: Identifier of the channel the messages arrived on
+        """
+        self.tenant_id = tenant_id
+        self.channel_id = channel_id
+        self.message_ids: List[str] = []
+        self.channel_message_ids: List[str] = []
+        self.sender_ids: List[str] = []
+        self.timestamps: List[str] = []
+        self.message_types: List[str] = []
+        self.contents: List[Dict[str, Any]] = []
+    
+    def __len__(self) -> int:
+        return len(self.message_ids)
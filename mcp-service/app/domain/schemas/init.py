@@ -9,6 +9,11 @@ from app.domain.schemas.message import (
     MessageBase,
     MessageContent,
     MessageCreate,
+    TextMessageCreate,
+    ImageMessageCreate,
+    GenericMessageCreate,
+    parse_message_create,
+    parse_message_creates,
     MessageResponse,
     MessageDeliveryStatus,
     MessageQuery,
@@ -20,6 +25,11 @@ __all__ = [
     "MessageBase",
     "MessageContent",
     "MessageCreate",
+    "TextMessageCreate",
+    "ImageMessageCreate",
+    "GenericMessageCreate",
+    "parse_message_create",
+    "parse_message_creates",
     "MessageResponse",
     "MessageDeliveryStatus",
     "MessageQuery",
@@ -7,9 +7,33 @@ requests and responses, ensuring consistent data structures.
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    TypeAdapter,
+    field_validator,
+)
+
+
+@lru_cache(maxsize=64)
+def _adapter(tp: Any) -> TypeAdapter:
+    # Building a TypeAdapter compiles a validator and serializer; do it once per type
+    return TypeAdapter(tp)
+
+
+# Datetime written as an ISO 8601 string in JSON output
+_IsoDatetime = Annotated[
+    datetime, PlainSerializer(lambda v: v.isoformat(), return_type=str, when_used="json")
+]
+
+# Shared config of the message schemas: unknown fields are dropped and
+# instances are immutable once validated
+_SCHEMA_CONFIG = ConfigDict(use_enum_values=True, extra="ignore", frozen=True)
 
 
 class MessageType(str, Enum):
@@ -41,6 +65,11 @@ class ContentType(str, Enum):
     UNKNOWN = "unknown"
 
 
+# Enum members by value, so inbound strings are coerced with one dict lookup
+_MT_BY_VALUE: Dict[str, MessageType] = {m.value: m for m in MessageType}
+_CT_BY_VALUE: Dict[str, ContentType] = {m.value: m for m in ContentType}
+
+
 class MessageBase(BaseModel):
     """Base schema for all message-related schemas."""
     
@@ -52,8 +81,19 @@ class MessageBase(BaseModel):
     recipient_id: Optional[str] = Field(None, description="Identifier of the recipient")
     conversation_id: Optional[str] = Field(None, description="Identifier of the conversation")
     
-    class Config:
-        use_enum_values = True
+    model_config = _SCHEMA_CONFIG
+    
+    @field_validator("message_type", mode="before")
+    @classmethod
+    def coerce_message_type(cls, v):
+        """Map a message type string to its enum member."""
+        return _MT_BY_VALUE.get(v, v) if isinstance(v, str) else v
+    
+    @field_validator("content_type", mode="before")
+    @classmethod
+    def coerce_content_type(cls, v):
+        """Map a content type string to its enum member."""
+        return _CT_BY_VALUE.get(v, v) if isinstance(v, str) else v
 
 
 class MessageContent(BaseModel):
@@ -62,42 +102,96 @@ class MessageContent(BaseModel):
     content: Union[str, Dict[str, Any], bytes] = Field(
         ..., description="The actual content of the message"
     )
-    
-    @validator("content")
-    def validate_content(cls, v, values):
-        """Validate content based on message_type and content_type."""
-        message_type = values.get("message_type")
-        content_type = values.get("content_type")
-        
-        if message_type == MessageType.TEXT:
-            if content_type != ContentType.TEXT_PLAIN:
-                raise ValueError(f"Invalid content_type for text message: {content_type}")
-            
-            if not isinstance(v, str):
-                raise ValueError("Content for text message must be a string")
-        
-        elif message_type == MessageType.IMAGE:
-            if not content_type.startswith("image/"):
-                raise ValueError(f"Invalid content_type for image message: {content_type}")
-        
-        # Additional validations can be added for other message types
-        
-        return v
 
 
-class MessageCreate(MessageBase, MessageContent):
-    """Schema for creating a new message."""
+class _MessageCreateBase(MessageBase, MessageContent):
+    """Fields shared by every kind of new message."""
     
     metadata: Optional[Dict[str, Any]] = Field(
         default={}, description="Additional metadata for the message"
     )
 
 
+class TextMessageCreate(_MessageCreateBase):
+    """Schema for creating a new text message."""
+    
+    message_type: Literal[MessageType.TEXT] = Field(..., description="Type of message")
+    content_type: Literal[ContentType.TEXT_PLAIN] = Field(
+        ..., description="MIME type of the content"
+    )
+    content: str = Field(..., description="The text of the message")
+
+
+class ImageMessageCreate(_MessageCreateBase):
+    """Schema for creating a new image message."""
+    
+    message_type: Literal[MessageType.IMAGE] = Field(..., description="Type of message")
+    content_type: Literal[
+        ContentType.IMAGE_JPEG, ContentType.IMAGE_PNG, ContentType.IMAGE_GIF
+    ] = Field(..., description="MIME type of the content")
+
+
+class GenericMessageCreate(_MessageCreateBase):
+    """Schema for creating a new message of a type without content rules."""
+    
+    message_type: Literal[
+        MessageType.AUDIO,
+        MessageType.VIDEO,
+        MessageType.DOCUMENT,
+        MessageType.LOCATION,
+        MessageType.CONTACT,
+        MessageType.INTERACTIVE,
+        MessageType.TEMPLATE,
+        MessageType.UNKNOWN,
+    ] = Field(..., description="Type of message")
+
+
+# Schema for creating a new message. Discriminated on message_type, so the
+# per-type content rules are part of the compiled schema and validation
+# dispatches to the matching model without a Python-level content validator
+MessageCreate = Annotated[
+    Union[TextMessageCreate, ImageMessageCreate, GenericMessageCreate],
+    Field(discriminator="message_type"),
+]
+
+
+def parse_message_create(data: Dict[str, Any]) -> _MessageCreateBase:
+    """
+    Validate a new message payload.
+    
+    Args:
+        data: Raw message payload
+        
+    Returns:
+        The validated message, as the model for its message type
+        
+    Raises:
+        pydantic.ValidationError: If the payload is invalid
+    """
+    return _adapter(MessageCreate).validate_python(data)
+
+
+def parse_message_creates(items: List[Dict[str, Any]]) -> List[_MessageCreateBase]:
+    """
+    Validate a batch of new message payloads in a single pass.
+    
+    Args:
+        items: Raw message payloads
+        
+    Returns:
+        Validated messages, in input order
+        
+    Raises:
+        pydantic.ValidationError: If any payload is invalid
+    """
+    return _adapter(List[MessageCreate]).validate_python(items)
+
+
 class MessageResponse(MessageBase, MessageContent):
     """Schema for message responses."""
     
     message_id: str = Field(..., description="Unique identifier for the message")
-    timestamp: datetime = Field(..., description="When the message was created")
+    timestamp: _IsoDatetime = Field(..., description="When the message was created")
     metadata: Dict[str, Any] = Field(
         default={}, description="Additional metadata for the message"
     )
@@ -105,10 +199,37 @@ class MessageResponse(MessageBase, MessageContent):
         None, description="Original message ID from the source channel"
     )
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "MessageResponse":
+        """
+        Build a response from data that was validated when it was stored.
+        
+        Uses model_construct, which skips type checking and coercion of the
+        fields and runs no field or model validators; fields missing from data
+        get their defaults. It must only be used for rows read back from
+        storage or caches. Untrusted input such as API request bodies must go
+        through model_validate.
+        
+        Args:
+            data: Stored message fields
+            
+        Returns:
+            A MessageResponse holding the given values as-is
+        """
+        return cls.model_construct(**data)
+    
+    @classmethod
+    def dump_many(cls, models: List["MessageResponse"]) -> List[Dict[str, Any]]:
+        """
+        Serialize a batch of responses to JSON-compatible dicts.
+        
+        Args:
+            models: Responses to serialize
+            
+        Returns:
+            One dict per response, in input order
+        """
+        return _adapter(list[cls]).dump_python(models, mode="json")
 
 
 class MessageDeliveryStatus(BaseModel):
@@ -119,16 +240,13 @@ class MessageDeliveryStatus(BaseModel):
         None, description="Channel-specific message ID"
     )
     status: str = Field(..., description="Delivery status (sent, delivered, read, failed)")
-    timestamp: datetime = Field(..., description="When the status was updated")
+    timestamp: _IsoDatetime = Field(..., description="When the status was updated")
     error: Optional[str] = Field(None, description="Error message if status is 'failed'")
     metadata: Optional[Dict[str, Any]] = Field(
         default={}, description="Additional metadata for the delivery status"
     )
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
+    model_config = _SCHEMA_CONFIG
 
 
 class MessageQuery(BaseModel):
@@ -145,5 +263,10 @@ class MessageQuery(BaseModel):
     limit: int = Field(50, description="Maximum number of messages to return")
     offset: int = Field(0, description="Number of messages to skip")
     
-    class Config:
-        use_enum_values = True
\ No newline at end of file
+    model_config = _SCHEMA_CONFIG
+    
+    @field_validator("message_type", mode="before")
+    @classmethod
+    def coerce_message_type(cls, v):
+        """Map a message type string to its enum member."""
+        return _MT_BY_VALUE.get(v, v) if isinstance(v, str) else v
\ No newline at end of file
@@ -78,7 +78,7 @@ class BaseFormatter(ABC):
         
         # Add custom metadata if present
         if metadata:
-            result["custom_metadata"] = metadata
+            result["custom_metadata"] = dict(metadata)
             
         return result
     
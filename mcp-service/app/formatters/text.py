@@ -1,8 +1,128 @@
-from typing import Any, Dict, Optional
+import re
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from app.formatters.base import BaseFormatter
 from app.domain.models.message import Message
-from app.utils.exceptions import FormattingError
+
+# Markdown link: [text](url)
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+# Channel-specific text formatting limits
+_CHANNEL_LIMITS = MappingProxyType({
+    "whatsapp": 4096,
+    "facebook": 2000,
+    "telegram": 4096,
+    "webchat": 10000,
+    "default": 4000  # Default fallback limit
+})
+
+# Channel-specific formatting options
+_CHANNEL_FORMATTING = MappingProxyType({
+    "whatsapp": {
+        "supports_bold": True,
+        "supports_italic": True,
+        "supports_code": False,
+        "supports_links": True
+    },
+    "facebook": {
+        "supports_bold": False,
+        "supports_italic": False,
+        "supports_code": False,
+        "supports_links": True
+    },
+    "telegram": {
+        "supports_bold": True,
+        "supports_italic": True,
+        "supports_code": True,
+        "supports_links": True
+    },
+    "webchat": {
+        "supports_bold": True,
+        "supports_italic": True,
+        "supports_code": True,
+        "supports_links": True
+    }
+})
+
+# Formatting options for channels without an entry above
+_DEFAULT_FORMAT = MappingProxyType({
+    "supports_bold": False,
+    "supports_italic": False,
+    "supports_code": False,
+    "supports_links": True
+})
+
+# Formatting option -> marker stripped when the channel lacks it, in strip order
+_FORMAT_MARKERS = (
+    ("supports_bold", "**"),
+    ("supports_italic", "_"),
+    ("supports_code", "`"),
+)
+
+
+def _strip_marker(text: str, marker: str) -> str:
+    # Markers pair up in order, so every pair can be dropped in one split;
+    # with an odd count the last marker is unmatched and kept
+    parts = text.split(marker)
+    if len(parts) % 2:
+        return "".join(parts)
+    return "".join(parts[:-1]) + marker + parts[-1]
+
+
+def _keep_formatting(text: str) -> str:
+    return text
+
+
+def _build_stripper(channel_format: Dict[str, bool]) -> Callable[[str], str]:
+    """
+    Build the function that strips a channel's unsupported formatting.
+    
+    Args:
+        channel_format: The channel's formatting options
+        
+    Returns:
+        Function applying only the strip steps the channel needs
+    """
+    markers = tuple(
+        marker for option, marker in _FORMAT_MARKERS if not channel_format[option]
+    )
+    strip_links = not channel_format["supports_links"]
+    
+    if not markers and not strip_links:
+        return _keep_formatting
+    
+    # One regex scan finds whether the text has anything to strip at all;
+    # most chat messages have no formatting and skip every strip pass
+    has_formatting = re.compile("|".join(
+        re.escape(token) for token in markers + (("[",) if strip_links else ())
+    )).search
+    
+    def strip(text: str) -> str:
+        if has_formatting(text) is None:
+            return text
+        for marker in markers:
+            text = _strip_marker(text, marker)
+        if strip_links:
+            # Extract just the URL text from markdown links
+            text = _MD_LINK_RE.sub(r'\1', text)
+        return text
+    
+    return strip
+
+
+# Channel -> (length limit, formatting stripper), resolved once at import
+_DEFAULT_PLAN: Tuple[int, Callable[[str], str]] = (
+    _CHANNEL_LIMITS["default"], _build_stripper(_DEFAULT_FORMAT)
+)
+_CHANNEL_PLAN: Dict[str, Tuple[int, Callable[[str], str]]] = {
+    channel_id: (
+        _CHANNEL_LIMITS.get(channel_id, _CHANNEL_LIMITS["default"]),
+        _build_stripper(_CHANNEL_FORMATTING.get(channel_id, _DEFAULT_FORMAT))
+    )
+    for channel_id in _CHANNEL_LIMITS.keys() | _CHANNEL_FORMATTING.keys()
+    if channel_id != "default"
+}
 
 
 class TextFormatter(BaseFormatter):
@@ -11,42 +131,9 @@ class TextFormatter(BaseFormatter):
     to channel-specific formats.
     """
     
-    # Channel-specific text formatting limits
-    CHANNEL_LIMITS = {
-        "whatsapp": 4096,
-        "facebook": 2000,
-        "telegram": 4096,
-        "webchat": 10000,
-        "default": 4000  # Default fallback limit
-    }
-    
-    # Channel-specific formatting options
-    CHANNEL_FORMATTING = {
-        "whatsapp": {
-            "supports_bold": True,
-            "supports_italic": True,
-            "supports_code": False,
-            "supports_links": True
-        },
-        "facebook": {
-            "supports_bold": False,
-            "supports_italic": False,
-            "supports_code": False,
-            "supports_links": True
-        },
-        "telegram": {
-            "supports_bold": True,
-            "supports_italic": True,
-            "supports_code": True,
-            "supports_links": True
-        },
-        "webchat": {
-            "supports_bold": True,
-            "supports_italic": True,
-            "supports_code": True,
-            "supports_links": True
-        }
-    }
+    # Module-level tables, kept here for existing callers
+    CHANNEL_LIMITS = _CHANNEL_LIMITS
+    CHANNEL_FORMATTING = _CHANNEL_FORMATTING
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize the text formatter with configuration."""
@@ -72,12 +159,18 @@ class TextFormatter(BaseFormatter):
         """
         self.logger.info(f"Formatting text message for channel {channel_id}")
         
-        if not self.validate_formatting_limits(message, channel_id):
+        max_length, strip = _CHANNEL_PLAN.get(channel_id, _DEFAULT_PLAN)
+        
+        # Same check and truncation as validate_formatting_limits/truncate_text,
+        # done inline with the limit already looked up
+        content = message.content
+        if len(content) > max_length:
             self.logger.warning(f"Message exceeds length limit for channel {channel_id}")
-            message.content = self.truncate_text(message.content, channel_id)
+            content = content[:max_length - 3] + "..."
+            message.content = content
         
-        # Process and strip unsupported formatting
-        formatted_text = self.add_formatting(message.content, channel_id)
+        # Strip unsupported formatting with the channel's prebuilt stripper
+        formatted_text = strip(content)
         
         # Build the formatted message
         formatted_message = {
@@ -89,6 +182,47 @@ class TextFormatter(BaseFormatter):
         self.logger.debug(f"Text message formatted successfully for channel {channel_id}")
         return formatted_message
     
+    def format_batch(self, messages: List[Message], channel_id: str) -> List[Dict[str, Any]]:
+        """
+        Format a batch of text messages bound for the same channel.
+        
+        Equivalent to calling format() on each message, but the channel plan
+        is resolved once and logging happens once per batch.
+        
+        Args:
+            messages: The messages to format
+            channel_id: The ID of the channel
+            
+        Returns:
+            The formatted messages, in input order
+        """
+        self.logger.info(f"Formatting {len(messages)} text messages for channel {channel_id}")
+        
+        max_length, strip = _CHANNEL_PLAN.get(channel_id, _DEFAULT_PLAN)
+        process_metadata = self.process_metadata
+        
+        formatted_messages = []
+        truncated = 0
+        for message in messages:
+            content = message.content
+            if len(content) > max_length:
+                content = content[:max_length - 3] + "..."
+                message.content = content
+                truncated += 1
+            
+            formatted_messages.append({
+                "type": "text",
+                "content": strip(content),
+                "metadata": process_metadata(message)
+            })
+        
+        if truncated:
+            self.logger.warning(
+                f"{truncated} of {len(messages)} messages exceeded length limit for channel {channel_id}"
+            )
+        
+        return formatted_messages
+    
     def truncate_text(self, text: str, channel_id: str) -> str:
         """
         Truncate text to the channel's maximum length.
@@ -100,7 +234,7 @@ class TextFormatter(BaseFormatter):
         Returns:
             The truncated text
         """
-        max_length = self.CHANNEL_LIMITS.get(channel_id, self.CHANNEL_LIMITS["default"])
+        max_length = _CHANNEL_LIMITS.get(channel_id, _CHANNEL_LIMITS["default"])
         
         if len(text) <= max_length:
             return text
@@ -120,30 +254,7 @@ class TextFormatter(BaseFormatter):
         Returns:
             The formatted text
         """
-        channel_format = self.CHANNEL_FORMATTING.get(
-            channel_id, {"supports_bold": False, "supports_italic": False, "supports_code": False, "supports_links": True}
-        )
-        
-        # Strip unsupported formatting based on channel capabilities
-        if not channel_format["supports_bold"]:
-            text = self.strip_unsupported(text, "**", "**")
-            
-        if not channel_format["supports_italic"]:
-            text = self.strip_unsupported(text, "_", "_")
-            
-        if not channel_format["supports_code"]:
-            text = self.strip_unsupported(text, "`", "`")
-            
-        # Process links if supported
-        if channel_format["supports_links"]:
-            # Keep links intact
-            pass
-        else:
-            # Extract just the URL text from markdown links
-            import re
-            text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'\1', text)
-        
-        return text
+        return _CHANNEL_PLAN.get(channel_id, _DEFAULT_PLAN)[1](text)
     
     def strip_unsupported(self, text: str, start_marker: str, end_marker: str) -> str:
         """
@@ -157,6 +268,9 @@ class TextFormatter(BaseFormatter):
         Returns:
             Text with formatting markers removed
         """
+        if start_marker == end_marker:
+            return _strip_marker(text, start_marker)
+        
         result = text
         marker_length = len(start_marker)
         
@@ -190,5 +304,5 @@ class TextFormatter(BaseFormatter):
         Returns:
             True if the message is within limits, False otherwise
         """
-        max_length = self.CHANNEL_LIMITS.get(channel_id, self.CHANNEL_LIMITS["default"])
+        max_length = _CHANNEL_LIMITS.get(channel_id, _CHANNEL_LIMITS["default"])
         return len(message.content) <= max_length
\ No newline at end of file
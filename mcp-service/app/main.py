@@ -1,17 +1,53 @@
-from fastapi import FastAPI, Request, Response
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 import logging
-import time
-import uuid
-from typing import List, Callable
+import queue
+
+import httpx
 
 from app.config import get_settings
+from app.api.middlewares.cors import OriginSetCORSMiddleware
+from app.api.middlewares.correlation_id import CorrelationIdASGIMiddleware
 from app.api.routers import health, webhooks
 from app.api.error_handlers import setup_exception_handlers
 from app.api.websocket.connection_manager import ConnectionManager
+from app.api.websocket.server import router as websocket_router
+from app.channels.channel_factory import ChannelFactory
+from app.channels.whatsapp.client import HTTP2_AVAILABLE, close_shared_session
 from app.utils.logger import setup_logging
 
+# Settings are read once at import; every use below shares this instance
+_SETTINGS = get_settings()
+
+# API documentation is only served in debug mode
+_DOCS_URL = "/api/docs" if _SETTINGS.DEBUG else None
+_REDOC_URL = "/api/redoc" if _SETTINGS.DEBUG else None
+_OPENAPI_URL = "/api/openapi.json" if _SETTINGS.DEBUG else None
+
+# Connection pool and timeouts of the HTTP client shared by request handlers
+HTTP_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+HTTP_CLIENT_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+
+def start_log_queue() -> QueueListener:
+    """
+    Move the root logger's handlers onto a background thread.
+
+    The handlers installed by setup_logging are replaced with a QueueHandler,
+    so log calls made on the event loop only enqueue the record, while
+    formatting and I/O happen in the listener's thread.
+
+    Returns:
+        The started listener; stop it on shutdown to flush queued records
+    """
+    root = logging.getLogger()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
 # Creating a lifespan context to handle startup and shutdown events
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -20,49 +56,73 @@ async def lifespan(app: FastAPI):
     Handles startup and shutdown events.
     """
     # Startup
-    settings = get_settings()
-    setup_logging(settings.logging.LEVEL, settings.logging.FORMAT)
-    logging.info(f"Starting {settings.APP_NAME} in {settings.ENV} mode")
+    setup_logging(_SETTINGS.logging.LEVEL, _SETTINGS.logging.FORMAT)
+    log_listener = start_log_queue()
+    logging.info("Starting %s in %s mode", _SETTINGS.APP_NAME, _SETTINGS.ENV)
     
     # Initialize connection manager as a singleton
     app.state.connection_manager = ConnectionManager()
     
+    # Pooled HTTP client shared by request handlers, so outgoing calls reuse
+    # TCP and TLS connections instead of opening new ones per request
+    app.state.http_client = httpx.AsyncClient(
+        limits=HTTP_CLIENT_LIMITS,
+        timeout=HTTP_CLIENT_TIMEOUT,
+        http2=HTTP2_AVAILABLE
+    )
+    
     # Startup additional services or connections here
     # ...
     
     yield
     
     # Shutdown
-    logging.info(f"Shutting down {settings.APP_NAME}")
+    logging.info("Shutting down %s", _SETTINGS.APP_NAME)
+    
+    # Stop connection manager background tasks
+    await app.state.connection_manager.shutdown()
+    
+    # Close cached channels, stopping their send queues
+    await ChannelFactory.close_instances()
+    
+    # Close the Graph API connection pool shared by WhatsApp clients
+    await close_shared_session()
+    
+    # Close the shared HTTP client's pooled connections
+    await app.state.http_client.aclose()
     
     # Close any connections or resources
     # ...
+    
+    # Flush queued log records and stop the logging thread
+    log_listener.stop()
 
 def create_application() -> FastAPI:
     """
     Creates and configures the FastAPI application.
     """
-    settings = get_settings()
-    
     app = FastAPI(
-        title=settings.APP_NAME,
+        title=_SETTINGS.APP_NAME,
         description="Message Control Processor (MCP) Service for the AI Chat Assistance Platform",
         version="0.1.0",
-        docs_url="/api/docs" if settings.DEBUG else None,
-        redoc_url="/api/redoc" if settings.DEBUG else None,
-        openapi_url="/api/openapi.json" if settings.DEBUG else None,
+        docs_url=_DOCS_URL,
+        redoc_url=_REDOC_URL,
+        openapi_url=_OPENAPI_URL,
+        # Serialize endpoint results with orjson instead of the stdlib json module
+        default_response_class=ORJSONResponse,
         lifespan=lifespan
     )
     
+    # Configure exception handlers; registered before the middleware stack
+    # is configured so the handlers are in place when it is built
+    setup_exception_handlers(app)
+    
     # Add middlewares
     configure_middleware(app)
     
     # Register routers
     register_routers(app)
     
-    # Configure exception handlers
-    setup_exception_handlers(app)
-    
     # Configure WebSocket
     configure_websocket(app)
     
@@ -72,100 +132,72 @@ def configure_middleware(app: FastAPI) -> None:
     """
     Configure middleware components for the application.
     """
-    settings = get_settings()
-    
-    # CORS middleware
+    # CORS middleware; "*" is handled by the base class's allow-all path
     app.add_middleware(
-        CORSMiddleware,
-        allow_origins=settings.CORS_ORIGINS,
+        OriginSetCORSMiddleware,
+        allow_origins=_SETTINGS.CORS_ORIGINS,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
     
-    # Correlation ID middleware
-    @app.middleware("http")
-    async def correlation_id_middleware(request: Request, call_next: Callable):
-        # Generate or extract correlation ID
-        correlation_id = request.headers.get(
-            settings.logging.CORRELATION_ID_HEADER, 
-            str(uuid.uuid4())
-        )
-        
-        # Add correlation ID to request state
-        request.state.correlation_id = correlation_id
-        
-        # Process request
-        start_time = time.time()
-        response = await call_next(request)
-        process_time = time.time() - start_time
-        
-        # Add correlation ID to response headers
-        response.headers[settings.logging.CORRELATION_ID_HEADER] = correlation_id
-        
-        # Log request details
-        logging.info(
-            f"Request processed",
-            extra={
-                "correlation_id": correlation_id,
-                "method": request.method,
-                "path": request.url.path,
-                "processing_time": process_time,
-                "status_code": response.status_code
-            }
-        )
-        
-        return response
-    
-    # Tenant context middleware
-    @app.middleware("http")
-    async def tenant_context_middleware(request: Request, call_next: Callable):
-        # Extract tenant ID from request
-        tenant_id = request.headers.get("X-Tenant-ID")
-        if tenant_id:
-            request.state.tenant_id = tenant_id
-        
-        return await call_next(request)
+    # Request context middleware: sets the correlation and tenant IDs
+    app.add_middleware(
+        CorrelationIdASGIMiddleware,
+        header_name=_SETTINGS.logging.CORRELATION_ID_HEADER,
+        sampled_paths=(f"{_SETTINGS.API_PREFIX}/health", "/metrics")
+    )
 
 def register_routers(app: FastAPI) -> None:
     """
     Register API routers with the application.
     """
-    settings = get_settings()
+    # Collect routers under one parent carrying the API prefix, so the app
+    # includes them in a single pass
+    api_router = APIRouter(prefix=_SETTINGS.API_PREFIX)
     
-    # Include routers with prefix
-    app.include_router(
+    api_router.include_router(
         health.router,
-        prefix=f"{settings.API_PREFIX}/health",
+        prefix="/health",
         tags=["health"]
     )
     
-    app.include_router(
+    api_router.include_router(
         webhooks.router,
-        prefix=f"{settings.API_PREFIX}/webhooks",
+        prefix="/webhooks",
         tags=["webhooks"]
     )
     
     # Add more routers here as they are implemented
     # ...
+    
+    app.include_router(api_router)
 
 def configure_websocket(app: FastAPI) -> None:
     """
     Configure WebSocket server components.
     """
-    # WebSocket endpoint will be configured in a separate module
-    # and registered here with the app
-    from app.api.websocket.server import router as websocket_router
+    # WebSocket endpoint is defined in app.api.websocket.server, imported
+    # once at module level, and registered here with the app
     app.include_router(websocket_router)
 
 app = create_application()
 
 if __name__ == "__main__":
     import uvicorn
+    # loop and http stay on "auto", which picks uvloop and httptools when
+    # they are installed. Requests are already logged by
+    # CorrelationIdASGIMiddleware, so uvicorn's access log is off.
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=get_settings().DEBUG,
-        log_level=get_settings().logging.LEVEL.lower()
+        reload=_SETTINGS.DEBUG,
+        # Must stay at one worker: ConnectionManager keeps WebSocket
+        # connections and their pub/sub channels in process memory, so with
+        # more workers a broadcast would only reach the connections of the
+        # worker that sent it. Raise this once fan-out works across processes.
+        workers=1,
+        access_log=False,
+        log_level=_SETTINGS.logging.LEVEL.lower()
     )
\ No newline at end of file
@@ -5,18 +5,112 @@ This package contains normalizers for converting channel-specific message format
 to/from the standardized internal format used throughout the system.
 """
 
+import sys
+from functools import lru_cache, singledispatch
+from types import MappingProxyType
+from typing import Any, Optional
+
+from app.domain.models.message import Message
 from app.normalizers.base import BaseNormalizer
 from app.normalizers.text import TextNormalizer
 from app.normalizers.image import ImageNormalizer
 from app.normalizers.interactive import InteractiveNormalizer
+from app.utils.exceptions import NormalizationError
 
 # Dictionary mapping message types to their normalizer classes
 # This can be extended as more normalizers are added
-NORMALIZER_MAP = {
-    "text": TextNormalizer,
-    "image": ImageNormalizer,
-    "interactive": InteractiveNormalizer,
-}
+NORMALIZER_MAP = MappingProxyType({
+    sys.intern(msg_type): normalizer_class
+    for msg_type, normalizer_class in {
+        "text": TextNormalizer,
+        "image": ImageNormalizer,
+        "interactive": InteractiveNormalizer,
+    }.items()
+})
+
+# Order in which normalizers are asked to recognise an untyped channel
+# message; the most specific shapes go first, since text matches almost
+# anything with a body
+_DETECTION_ORDER = ("interactive", "image", "text")
+
+
+@lru_cache(maxsize=1024)
+def get_normalizer_for_type(msg_type: str, channel_id: str, tenant_id: str) -> BaseNormalizer:
+    """
+    Get the normalizer for a message type.
+
+    Normalizers hold no per-message state, so one instance is shared per
+    (msg_type, channel_id, tenant_id) instead of creating one per message.
+
+    Args:
+        msg_type (str): The message type, a key of NORMALIZER_MAP
+        channel_id (str): The identifier for the messaging channel
+        tenant_id (str): The identifier for the tenant
+
+    Returns:
+        BaseNormalizer: Shared normalizer instance
+
+    Raises:
+        NormalizationError: If no normalizer handles the message type
+    """
+    normalizer_class = NORMALIZER_MAP.get(msg_type)
+    if normalizer_class is None:
+        raise NormalizationError(f"No normalizer for message type '{msg_type}'")
+    return normalizer_class(channel_id, tenant_id)
+
+
+@singledispatch
+def _detect_message_type(channel_message: Any, channel_id: str, tenant_id: str) -> Optional[str]:
+    # Dispatched on the Python type of the message; singledispatch caches the
+    # resolved implementation per type, subclasses included
+    raise NormalizationError(
+        f"Cannot normalize message of type {type(channel_message).__name__}"
+    )
+
+
+@_detect_message_type.register
+def _type_of_channel_dict(channel_message: dict, channel_id: str, tenant_id: str) -> Optional[str]:
+    msg_type = channel_message.get("type")
+    if msg_type in NORMALIZER_MAP:
+        return msg_type
+
+    # Fall back to the normalizers' own detection heuristics
+    for candidate in _DETECTION_ORDER:
+        normalizer = get_normalizer_for_type(candidate, channel_id, tenant_id)
+        if normalizer._get_message_type(channel_message) == candidate:
+            return candidate
+    return None
+
+
+@_detect_message_type.register
+def _type_of_internal_message(message: Message, channel_id: str, tenant_id: str) -> Optional[str]:
+    return message.message_type
+
+
+def get_normalizer_for_message(channel_message: Any, channel_id: str, tenant_id: str) -> BaseNormalizer:
+    """
+    Get the normalizer for a message.
+
+    Channel messages (dicts) are matched on their "type" field, falling back
+    to the normalizers' detection heuristics; internal messages are matched
+    on their message_type.
+
+    Args:
+        channel_message (Any): Channel-specific or internal message
+        channel_id (str): The identifier for the messaging channel
+        tenant_id (str): The identifier for the tenant
+
+    Returns:
+        BaseNormalizer: Shared normalizer instance
+
+    Raises:
+        NormalizationError: If the message type cannot be determined or has no normalizer
+    """
+    msg_type = _detect_message_type(channel_message, channel_id, tenant_id)
+    if msg_type is None:
+        raise NormalizationError("Could not determine message type")
+    return get_normalizer_for_type(msg_type, channel_id, tenant_id)
+
 
 __all__ = [
     "BaseNormalizer",
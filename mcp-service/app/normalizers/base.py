@@ -7,6 +7,7 @@ a standardized internal format used throughout the system.
 """
 
 import abc
+import logging
 from typing import Any, Dict, Optional, TypeVar, Generic, List
 
 from app.domain.models.message import Message
@@ -25,6 +26,7 @@ class BaseNormalizer(Generic[T], abc.ABC):
     Each messaging channel (WhatsApp, Facebook, Telegram, etc.) requires a specific
     normalizer implementation to convert between channel-specific and internal formats.
     """
+    __slots__ = ("channel_id", "tenant_id", "_cls_name")
     
     def __init__(self, channel_id: str, tenant_id: str):
         """
@@ -36,7 +38,8 @@ class BaseNormalizer(Generic[T], abc.ABC):
         """
         self.channel_id = channel_id
         self.tenant_id = tenant_id
-        logger.debug(f"Initialized {self.__class__.__name__} for channel={channel_id}, tenant={tenant_id}")
+        self._cls_name = type(self).__name__
+        logger.debug("Initialized %s for channel=%s, tenant=%s", self._cls_name, channel_id, tenant_id)
     
     @abc.abstractmethod
     def normalize(self, channel_message: T) -> Message:
@@ -124,8 +127,12 @@ class BaseNormalizer(Generic[T], abc.ABC):
             direction (str): Either 'normalize' or 'denormalize'
             message_id (Optional[str]): Message ID if available
         """
+        # Called on every (de)normalization; skip formatting unless DEBUG is on
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
         msg_info = f" for message {message_id}" if message_id else ""
         logger.debug(
-            f"Attempting to {direction} message{msg_info} using {self.__class__.__name__} "
-            f"(channel={self.channel_id}, tenant={self.tenant_id})"
+            "Attempting to %s message%s using %s (channel=%s, tenant=%s)",
+            direction, msg_info, self._cls_name, self.channel_id, self.tenant_id
         )
\ No newline at end of file
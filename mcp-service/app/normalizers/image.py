@@ -29,6 +29,22 @@ SUPPORTED_IMAGE_EXTENSIONS = {
     '.jpg', '.jpeg', '.png', '.gif', '.webp', '.tiff', '.bmp'
 }
 
+# MIME types of the supported extensions, looked up before falling back
+# to the mimetypes database
+_EXT_TO_MIME = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.tiff': 'image/tiff',
+    '.bmp': 'image/bmp',
+}
+
+# Accepted image URL prefixes; requiring "//" after the scheme rejects
+# forms such as "http:foo.png" or "file:/etc/passwd" that urlparse accepts
+_URL_SCHEME_RE = re.compile(r'^(http|https|file)://', re.IGNORECASE)
+
 
 class ImageNormalizer(BaseNormalizer):
     """
@@ -37,6 +53,7 @@ class ImageNormalizer(BaseNormalizer):
     Converts channel-specific image message formats to/from the standardized
     internal message format.
     """
+    __slots__ = ("max_size_kb", "allow_remote_urls", "verify_mime_type")
     
     def __init__(self, channel_id: str, tenant_id: str, 
                  max_size_kb: int = 10240,  # 10MB default max
@@ -171,7 +188,7 @@ class ImageNormalizer(BaseNormalizer):
                     channel_message["size"] = message.metadata["size"]
                 
                 # Add any additional metadata as a nested object
-                channel_message["metadata"] = message.metadata
+                channel_message["metadata"] = dict(message.metadata)
             
             return channel_message
         
@@ -246,17 +263,17 @@ class ImageNormalizer(BaseNormalizer):
         
         # It's a URL, validate it
         result["is_url"] = True
+        parsed_url = urlparse(url)
         
         # Check if remote URLs are allowed
         if not self.allow_remote_urls:
-            parsed_url = urlparse(url)
             is_remote = parsed_url.scheme in ('http', 'https')
             
             if is_remote:
                 raise ValidationError("Remote image URLs are not allowed")
         
         # Validate URL format (basic check)
-        if not re.match(r'^(http|https|file)://', url):
+        if not _URL_SCHEME_RE.match(url):
             raise ValidationError(f"Invalid URL scheme: {url}")
         
         # Check file extension if verifying MIME types
@@ -270,7 +287,7 @@ class ImageNormalizer(BaseNormalizer):
                     raise ValidationError(f"Unsupported image MIME type: {mime_type}")
             else:
                 # No MIME type determined, check extension
-                _, ext = os.path.splitext(urlparse(url).path)
+                _, ext = os.path.splitext(parsed_url.path)
                 ext = ext.lower()
                 
                 if ext and ext not in SUPPORTED_IMAGE_EXTENSIONS:
@@ -573,7 +590,9 @@ class ImageNormalizer(BaseNormalizer):
             ext = ext.lower()
             
             # Get the MIME type for the extension
-            mime_type, _ = mimetypes.guess_type(f"file{ext}")
+            mime_type = _EXT_TO_MIME.get(ext)
+            if mime_type is None:
+                mime_type, _ = mimetypes.guess_type(f"file{ext}")
             
             return mime_type
         except:
@@ -30,6 +30,7 @@ class InteractiveNormalizer(BaseNormalizer):
     internal message format. Interactive messages include buttons, lists, menus,
     quick replies, carousels, and other interactive elements.
     """
+    __slots__ = ("max_elements", "validate_structure")
     
     def __init__(self, channel_id: str, tenant_id: str, 
                  max_elements: int = 10,
@@ -161,7 +162,7 @@ class InteractiveNormalizer(BaseNormalizer):
             # Add metadata
             if message.metadata:
                 # Add any additional metadata as a nested object
-                channel_message["metadata"] = message.metadata
+                channel_message["metadata"] = dict(message.metadata)
             
             return channel_message
         
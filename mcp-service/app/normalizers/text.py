@@ -36,6 +36,7 @@ class TextNormalizer(BaseNormalizer):
     Converts channel-specific text message formats to/from the standardized
     internal message format.
     """
+    __slots__ = ("max_length", "detect_entities", "sanitize_input", "entity_patterns")
     
     def __init__(self, channel_id: str, tenant_id: str, 
                  max_length: int = 4096, 
@@ -154,7 +155,7 @@ class TextNormalizer(BaseNormalizer):
             
             # Add any additional metadata
             if message.metadata:
-                channel_message["metadata"] = message.metadata
+                channel_message["metadata"] = dict(message.metadata)
             
             return channel_message
         
@@ -126,7 +126,7 @@ class ChatRouter(RouterBase):
             "timestamp": message.timestamp.isoformat() if message.timestamp else datetime.now().isoformat(),
             "channel_id": message.channel_id,
             "message_type": message.message_type,
-            "metadata": message.metadata or {},
+            "metadata": dict(message.metadata),
         }
         
         # Add attachments if present
@@ -0,0 +1,71 @@
+import asyncio
+from typing import Any, Dict
+
+from app.channels import channel_factory
+from app.channels.base import BaseChannel
+from app.channels.channel_factory import INSTANCE_CACHE_TTL, ChannelFactory
+
+CONFIG = {"channel_id": "channel-1", "tenant_id": "tenant-1"}
+
+
+class FakeClock:
+    """Stands in for the time module used by the factory."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class FakeChannel(BaseChannel):
+    async def send_message(self, message: Any) -> Dict[str, Any]:
+        if self.is_closed:
+            raise RuntimeError("channel is closed")
+        return {"status": "sent"}
+
+    def receive_message(self, payload):
+        raise NotImplementedError
+
+    def normalize_message(self, payload):
+        raise NotImplementedError
+
+    def format_response(self, message):
+        raise NotImplementedError
+
+
+def _isolated_factory(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(channel_factory, "time", clock)
+    monkeypatch.setattr(ChannelFactory, "_registry", {})
+    monkeypatch.setattr(ChannelFactory, "_instance_cache", {})
+    monkeypatch.setattr(ChannelFactory, "_closing_tasks", set())
+    ChannelFactory.register_channel("fake", FakeChannel)
+    return clock
+
+
+def test_cache_ttl_is_refreshed_on_use(monkeypatch):
+    clock = _isolated_factory(monkeypatch)
+
+    channel = ChannelFactory.create_channel("fake", CONFIG)
+    for _ in range(3):
+        clock.now += INSTANCE_CACHE_TTL - 1
+        assert ChannelFactory.create_channel("fake", CONFIG) is channel
+
+
+def test_instance_held_past_ttl_still_sends(monkeypatch):
+    clock = _isolated_factory(monkeypatch)
+
+    async def scenario():
+        held = ChannelFactory.create_channel("fake", CONFIG)
+
+        clock.now += INSTANCE_CACHE_TTL + 1
+        replacement = ChannelFactory.create_channel("fake", CONFIG)
+        # Let any close() scheduled for the dropped instance run
+        await asyncio.sleep(0)
+
+        assert replacement is not held
+        assert not held.is_closed
+        assert await held.send_message({"text": "hello"}) == {"status": "sent"}
+
+    asyncio.run(scenario())